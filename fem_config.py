@@ -4,18 +4,40 @@ FEM Configuration Schema
 
 Pydantic models for validating YAML configuration files.
 """
+import hashlib
+import json
+import os
+import tempfile
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Optional, Literal, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel, ConfigDict, Field, TypeAdapter, ValidationInfo, field_validator,
+    model_validator
+)
+from pydantic.dataclasses import dataclass
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+# Mesh element type -> SolidsPy element type ID
+_ELE_TYPE_MAP = MappingProxyType({
+    "triangle": 3,
+    "triangle6": 2,
+    "quad": 1
+})
+
 
 class Material(BaseModel):
     """Material properties"""
     E: float = Field(..., description="Young's modulus", gt=0)
     nu: float = Field(..., description="Poisson's ratio", ge=0, lt=0.5)
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class GeometryRectangle(BaseModel):
@@ -24,8 +46,7 @@ class GeometryRectangle(BaseModel):
     length: float = Field(..., gt=0)
     height: float = Field(..., gt=0)
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class GeometryLShape(BaseModel):
@@ -36,20 +57,21 @@ class GeometryLShape(BaseModel):
     flange_width: float = Field(..., gt=0, description="Horizontal flange width")
     flange_height: float = Field(..., gt=0, description="Vertical flange height")
 
-    @validator('flange_width')
-    def validate_flange_width(cls, v, values):
-        if 'width' in values and v > values['width']:
+    @field_validator('flange_width')
+    @classmethod
+    def validate_flange_width(cls, v, info: ValidationInfo):
+        if 'width' in info.data and v > info.data['width']:
             raise ValueError('flange_width must be <= width')
         return v
 
-    @validator('flange_height')
-    def validate_flange_height(cls, v, values):
-        if 'height' in values and v > values['height']:
+    @field_validator('flange_height')
+    @classmethod
+    def validate_flange_height(cls, v, info: ValidationInfo):
+        if 'height' in info.data and v > info.data['height']:
             raise ValueError('flange_height must be <= height')
         return v
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class GeometryPlateWithHole(BaseModel):
@@ -61,50 +83,53 @@ class GeometryPlateWithHole(BaseModel):
     hole_y: float = Field(..., description="Hole center y-coordinate")
     hole_radius: float = Field(..., gt=0)
 
-    @validator('hole_x')
-    def validate_hole_x(cls, v, values):
-        if 'length' in values:
-            if v < 0 or v > values['length']:
-                raise ValueError(f'hole_x must be between 0 and {values["length"]}')
+    @field_validator('hole_x')
+    @classmethod
+    def validate_hole_x(cls, v, info: ValidationInfo):
+        if 'length' in info.data:
+            if v < 0 or v > info.data['length']:
+                raise ValueError(f'hole_x must be between 0 and {info.data["length"]}')
         return v
 
-    @validator('hole_y')
-    def validate_hole_y(cls, v, values):
-        if 'height' in values:
-            if v < 0 or v > values['height']:
-                raise ValueError(f'hole_y must be between 0 and {values["height"]}')
+    @field_validator('hole_y')
+    @classmethod
+    def validate_hole_y(cls, v, info: ValidationInfo):
+        if 'height' in info.data:
+            if v < 0 or v > info.data['height']:
+                raise ValueError(f'hole_y must be between 0 and {info.data["height"]}')
         return v
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class Layer(BaseModel):
     """Material layer definition for layered geometries"""
     name: str
-    region: List[float] = Field(..., min_items=2, max_items=2,
+    region: List[float] = Field(..., min_length=2, max_length=2,
                                  description="[y_min, y_max] for layer")
     physical_id: int = Field(..., ge=1, description="Physical surface ID")
     material: Material
 
-    @validator('region')
+    @field_validator('region')
+    @classmethod
     def validate_region(cls, v):
         if v[0] >= v[1]:
             raise ValueError('region[0] must be < region[1]')
         return v
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
-class Constraints(BaseModel):
-    """Boundary condition constraints"""
+@dataclass(frozen=True, config=ConfigDict(extra="forbid"))
+class Constraints:
+    """Boundary condition constraints
+
+    A Pydantic dataclass: validated on construction and as a field of
+    ``BoundaryCondition``, without the overhead of a full sub-model.
+    """
     x: Literal["fixed", "free"] = "free"
     y: Literal["fixed", "free"] = "free"
 
-    class Config:
-        extra = "forbid"
-
 
 class BoundaryCondition(BaseModel):
     """Boundary condition definition"""
@@ -116,18 +141,15 @@ class BoundaryCondition(BaseModel):
     physical_id: int = Field(..., ge=1, description="Physical line ID")
     constraints: Constraints
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
-class Force(BaseModel):
-    """Force components"""
+@dataclass(frozen=True, config=ConfigDict(extra="forbid"))
+class Force:
+    """Force components (Pydantic dataclass, see ``Constraints``)"""
     x: float = 0.0
     y: float = 0.0
 
-    class Config:
-        extra = "forbid"
-
 
 class Load(BaseModel):
     """Load definition"""
@@ -140,8 +162,7 @@ class Load(BaseModel):
     force: Force = Field(..., description="Total force on the line")
     distribution: Literal["uniform"] = "uniform"
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MeshParameters(BaseModel):
@@ -150,8 +171,7 @@ class MeshParameters(BaseModel):
     element_type: Literal["triangle", "triangle6", "quad"] = "triangle"
     algorithm: Optional[int] = Field(None, ge=1, le=9, description="GMSH meshing algorithm")
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class FEMConfig(BaseModel):
@@ -171,86 +191,110 @@ class FEMConfig(BaseModel):
     boundary_conditions: List[BoundaryCondition]
     loads: Optional[List[Load]] = None
 
-    @validator('layers')
-    def validate_layers_or_material(cls, v, values):
-        """Ensure either material or layers is specified, not both"""
-        if v is not None and values.get('material') is not None:
+    @model_validator(mode='after')
+    def validate_layers(self):
+        """Ensure either material or layers is specified and layers don't overlap"""
+        if self.layers is not None and self.material is not None:
             raise ValueError('Specify either "material" or "layers", not both')
-        if v is None and values.get('material') is None:
+        if self.layers is None and self.material is None:
             raise ValueError('Must specify either "material" or "layers"')
-        return v
-
-    @validator('layers')
-    def validate_no_overlapping_layers(cls, v):
-        """Ensure layers don't overlap"""
-        if v is None:
-            return v
-
-        # Check for overlapping regions
-        for i, layer1 in enumerate(v):
-            for layer2 in v[i+1:]:
-                y1_min, y1_max = layer1.region
-                y2_min, y2_max = layer2.region
 
-                # Check overlap
-                if not (y1_max <= y2_min or y2_max <= y1_min):
+        if self.layers is not None:
+            # Check for overlapping regions: sorted by y_min, only neighbours
+            # can overlap
+            ordered = sorted(self.layers, key=lambda layer: layer.region[0])
+            for lower, upper in zip(ordered, ordered[1:]):
+                if lower.region[1] > upper.region[0]:
                     raise ValueError(
-                        f'Layers "{layer1.name}" and "{layer2.name}" overlap'
+                        f'Layers "{lower.name}" and "{upper.name}" overlap'
                     )
-        return v
+        return self
 
-    @validator('boundary_conditions')
-    def validate_unique_physical_ids(cls, v, values):
+    @model_validator(mode='after')
+    def validate_unique_physical_ids(self):
         """Ensure all physical IDs are unique"""
-        all_ids = set()
-
-        # Collect BC IDs
-        for bc in v:
-            if bc.physical_id in all_ids:
-                raise ValueError(f'Duplicate physical_id: {bc.physical_id}')
-            all_ids.add(bc.physical_id)
-
-        # Collect load IDs
-        if 'loads' in values and values['loads']:
-            for load in values['loads']:
-                if load.physical_id in all_ids:
-                    raise ValueError(f'Duplicate physical_id: {load.physical_id}')
-                all_ids.add(load.physical_id)
-
-        # Collect layer IDs
-        if 'layers' in values and values['layers']:
-            for layer in values['layers']:
-                if layer.physical_id in all_ids:
-                    raise ValueError(f'Duplicate physical_id: {layer.physical_id}')
-                all_ids.add(layer.physical_id)
+        # Collect BC, load and layer IDs in a single pass
+        ids = [item.physical_id for item in chain(
+            self.boundary_conditions, self.loads or [], self.layers or []
+        )]
+        if len(set(ids)) != len(ids):
+            seen = set()
+            duplicate = next(i for i in ids if i in seen or seen.add(i))
+            raise ValueError(f'Duplicate physical_id: {duplicate}')
 
-        return v
+        return self
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
     @classmethod
     def from_yaml(cls, yaml_path: str) -> 'FEMConfig':
-        """Load configuration from YAML file"""
-        with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
-        return cls(**data)
+        """Load configuration from YAML file
+
+        A ``<yaml_path>.cache.json`` sidecar holding the validated model and
+        a hash of the YAML content is written after the first load. It is
+        reused only while the hash matches, so repeated runs skip the YAML
+        parser; an unreadable or stale sidecar falls back to the YAML.
+        """
+        raw = Path(yaml_path).read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        sidecar = Path(f"{yaml_path}.cache.json")
+
+        try:
+            cached = json.loads(sidecar.read_bytes())
+            if isinstance(cached, dict) and cached.get("sha256") == digest:
+                return _CONFIG_ADAPTER.validate_python(cached["config"])
+        except (OSError, ValueError, KeyError):
+            pass  # Missing, corrupt or outdated sidecar: parse the YAML
+
+        config = _CONFIG_ADAPTER.validate_python(yaml.load(raw, Loader=SafeLoader))
+        _write_sidecar(sidecar, {
+            "sha256": digest,
+            "config": config.model_dump(exclude_none=True)
+        })
+        return config
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'FEMConfig':
+        """Load configuration from a JSON document (e.g. a cache sidecar)"""
+        return _CONFIG_ADAPTER.validate_json(raw)
 
     def to_yaml(self, yaml_path: str):
-        """Save configuration to YAML file"""
-        with open(yaml_path, 'w') as f:
-            yaml.dump(
-                self.dict(exclude_none=True),
-                f,
-                default_flow_style=False,
-                sort_keys=False
-            )
+        """Save configuration to YAML file
+
+        The file is left untouched if it already holds the same content.
+        """
+        body = yaml.dump(
+            self.model_dump(mode='json', exclude_none=True),
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False
+        )
+        path = Path(yaml_path)
+        if path.exists() and path.read_text() == body:
+            return
+        path.write_text(body)
 
     def get_solidspy_element_type(self) -> int:
         """Map mesh element type to SolidsPy element type ID"""
-        mapping = {
-            "triangle": 3,
-            "triangle6": 2,
-            "quad": 1
-        }
-        return mapping[self.mesh.element_type]
+        return _ELE_TYPE_MAP[self.mesh.element_type]
+
+
+# Built once and shared by every load instead of per call
+_CONFIG_ADAPTER = TypeAdapter(FEMConfig)
+
+
+def _write_sidecar(path: Path, payload: dict):
+    """Atomically write a JSON cache sidecar (temp file + ``os.replace``)"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    except OSError:
+        return  # Cache is optional (e.g. read-only directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
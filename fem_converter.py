@@ -8,11 +8,14 @@ Converts YAML configuration to SolidsPy input files.
 
 Usage:
     python fem_converter.py model.yaml [--output-dir OUTPUT_DIR]
+    python fem_converter.py a.yaml b.yaml ... [--output-dir OUTPUT_DIR]
 """
 import argparse
+import functools
 import os
 import sys
 import subprocess
+from collections import deque
 import numpy as np
 import meshio
 from pathlib import Path
@@ -22,6 +25,120 @@ from geo_generator import GeoGenerator
 import preprocesor as msh
 
 
+def _write_table(path, array, fmt):
+    """Write a 2D array as whitespace-separated rows in a single write.
+
+    Equivalent to ``np.savetxt(path, array, fmt=fmt)`` but the whole table
+    is formatted with one ``%`` operation instead of one per row.
+    """
+    array = np.atleast_2d(array)
+    if isinstance(fmt, str):
+        fmt = (fmt,) * array.shape[1]
+    row_fmt = " ".join(fmt) + "\n"
+    Path(path).write_text((row_fmt * len(array)) % tuple(array.ravel().tolist()))
+
+
+@functools.lru_cache(maxsize=1)
+def _find_gmsh():
+    """Find GMSH executable (probed once per process)"""
+    # Check local directory first
+    local_gmsh = Path("./gmsh.exe")
+    if local_gmsh.exists():
+        return str(local_gmsh)
+
+    # Check if gmsh is in PATH
+    try:
+        result = subprocess.run(
+            ["gmsh", "--version"],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            return "gmsh"
+    except FileNotFoundError:
+        pass
+
+    return None
+
+
+def _index_cells(cells, cell_data):
+    """Group mesh connectivity by cell type and physical tag in one pass.
+
+    Returns a dict mapping ``(cell_type, physical_id)`` to the connectivity
+    of all matching cells, concatenated in mesh block order.
+    """
+    groups = {}
+    for block, tags in zip(cells, cell_data["gmsh:physical"]):
+        data = np.asarray(block.data)
+        tags = np.asarray(tags)
+        order = np.argsort(tags, kind="stable")
+        uniq, starts = np.unique(tags[order], return_index=True)
+        for tag, rows in zip(uniq, np.split(order, starts[1:])):
+            groups.setdefault((block.type, int(tag)), []).append(data[rows])
+    return {key: np.vstack(parts) if len(parts) > 1 else parts[0]
+            for key, parts in groups.items()}
+
+
+def _surface_cells(cell_index, ele_tag, phy_sur):
+    """Connectivity of the ``ele_tag`` cells on a physical surface"""
+    eles = cell_index.get((ele_tag, phy_sur))
+    if eles is None:
+        raise ValueError(
+            f"Physical surface {phy_sur} not found in mesh for element type '{ele_tag}'"
+        )
+    return eles
+
+
+def _ele_writer(cell_index, ele_tag, phy_sur, ele_type, mat_tag, nini, out=None):
+    """Indexed equivalent of ``preprocesor.ele_writer``
+
+    If ``out`` is given, the elements are written into rows
+    ``nini:nf`` of it instead of a new array.
+    """
+    eles = _surface_cells(cell_index, ele_tag, phy_sur)
+    n_matched = len(eles)
+    if out is None:
+        els_array = np.zeros([n_matched, 3 + eles.shape[1]], dtype=np.int32)
+    else:
+        els_array = out[nini:nini + n_matched]
+    els_array[:, 0] = np.arange(nini, n_matched + nini)
+    els_array[:, 1] = ele_type
+    els_array[:, 2] = mat_tag
+    els_array[:, 3:] = eles
+    return nini + n_matched, els_array
+
+
+def _index_line_nodes(cell_index):
+    """Unique node IDs of every physical line, keyed by physical_id"""
+    return {tag: np.unique(lines)
+            for (cell_type, tag), lines in cell_index.items()
+            if cell_type == "line"}
+
+
+def _line_nodes(line_index, phy_lin):
+    """Unique node IDs on a physical line"""
+    nodes = line_index.get(phy_lin)
+    if nodes is None:
+        raise ValueError(f"Physical line {phy_lin} not found in mesh")
+    return nodes
+
+
+def _loading(line_index, phy_lin, P_x, P_y, nodes_carga=None, out=None):
+    """Indexed equivalent of ``preprocesor.loading``
+
+    ``nodes_carga`` may be passed if already looked up, and ``out`` is an
+    optional ``(ncargas, 3)`` buffer to fill instead of a new array.
+    """
+    if nodes_carga is None:
+        nodes_carga = _line_nodes(line_index, phy_lin)
+    ncargas = len(nodes_carga)
+    cargas = np.zeros((ncargas, 3)) if out is None else out
+    cargas[:, 0] = nodes_carga
+    cargas[:, 1] = P_x/ncargas
+    cargas[:, 2] = P_y/ncargas
+    return cargas
+
+
 class FEMConverter:
     """Main converter class"""
 
@@ -79,8 +196,12 @@ class FEMConverter:
 
     def _run_gmsh(self):
         """Run GMSH to generate mesh"""
+        self._finish_gmsh(self._start_gmsh())
+
+    def _start_gmsh(self):
+        """Launch GMSH on the .geo file without waiting for it"""
         # Try to find GMSH executable
-        gmsh_exe = self._find_gmsh()
+        gmsh_exe = _find_gmsh()
 
         if not gmsh_exe:
             raise FileNotFoundError(
@@ -88,39 +209,26 @@ class FEMConverter:
                 "place gmsh.exe in the project directory."
             )
 
-        # Run GMSH
         cmd = [gmsh_exe, str(self.geo_file), "-2", "-o", str(self.msh_file)]
-        result = subprocess.run(
+        return subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
 
-        if result.returncode != 0:
+    def _finish_gmsh(self, proc):
+        """Wait for a GMSH process started by ``_start_gmsh``"""
+        _, stderr = proc.communicate()
+
+        if proc.returncode != 0:
             print("GMSH Error:")
-            print(result.stderr)
+            print(stderr)
             raise RuntimeError("GMSH execution failed")
 
     def _find_gmsh(self):
         """Find GMSH executable"""
-        # Check local directory first
-        local_gmsh = Path("./gmsh.exe")
-        if local_gmsh.exists():
-            return str(local_gmsh)
-
-        # Check if gmsh is in PATH
-        try:
-            result = subprocess.run(
-                ["gmsh", "--version"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                return "gmsh"
-        except FileNotFoundError:
-            pass
-
-        return None
+        return _find_gmsh()
 
     def _convert_to_solidspy(self):
         """Convert mesh to SolidsPy format"""
@@ -134,32 +242,43 @@ class FEMConverter:
         # Convert nodes
         nodes_array = msh.node_writer(points, point_data)
 
+        # Index cells by physical tag once instead of rescanning per call
+        cell_index = _index_cells(cells, cell_data)
+        line_index = _index_line_nodes(cell_index)
+
         # Element type for SolidsPy
         ele_type = self.config.get_solidspy_element_type()
 
         # Convert elements
         if self.config.layers:
-            # Multi-material case
-            elements_list = []
-            nini = 0
+            # Multi-material case: size the element table up front and fill
+            # each layer's rows in place
+            layer_cells = [
+                _surface_cells(cell_index, self.config.mesh.element_type,
+                               layer.physical_id)
+                for layer in self.config.layers
+            ]
+            elements_array = np.empty(
+                (sum(len(eles) for eles in layer_cells), 3 + layer_cells[0].shape[1]),
+                dtype=np.int32
+            )
+            # First element id of each layer
+            offsets = np.cumsum([0] + [len(eles) for eles in layer_cells[:-1]])
 
             for mat_idx, layer in enumerate(self.config.layers):
-                nf, layer_els = msh.ele_writer(
-                    cells, cell_data,
+                _ele_writer(
+                    cell_index,
                     self.config.mesh.element_type,
                     layer.physical_id,  # Physical surface ID from GMSH
                     ele_type,
                     mat_idx,  # Material tag = row index in mater.txt (0, 1, 2, ...)
-                    nini
+                    int(offsets[mat_idx]),
+                    out=elements_array
                 )
-                elements_list.append(layer_els)
-                nini = nf
-
-            elements_array = np.vstack(elements_list)
         else:
             # Single material case
-            nf, elements_array = msh.ele_writer(
-                cells, cell_data,
+            nf, elements_array = _ele_writer(
+                cell_index,
                 self.config.mesh.element_type,
                 1,  # Physical surface ID
                 ele_type,
@@ -169,30 +288,27 @@ class FEMConverter:
 
         # Apply boundary conditions
         for bc in self.config.boundary_conditions:
-            bc_x = -1 if bc.constraints.x == "fixed" else 0
-            bc_y = -1 if bc.constraints.y == "fixed" else 0
-            nodes_array = msh.boundary_conditions(
-                cells, cell_data,
-                bc.physical_id,
-                nodes_array,
-                bc_x, bc_y
-            )
+            bc_nodes = _line_nodes(line_index, bc.physical_id)
+            nodes_array[bc_nodes, 3] = -1 if bc.constraints.x == "fixed" else 0
+            nodes_array[bc_nodes, 4] = -1 if bc.constraints.y == "fixed" else 0
 
         # Apply loads
         loads_array = None
         if self.config.loads:
-            loads_list = []
-            for load in self.config.loads:
-                load_array = msh.loading(
-                    cells, cell_data,
+            load_nodes = [_line_nodes(line_index, load.physical_id)
+                          for load in self.config.loads]
+            loads_array = np.empty((sum(len(n) for n in load_nodes), 3))
+            offset = 0
+            for load, nodes_carga in zip(self.config.loads, load_nodes):
+                _loading(
+                    line_index,
                     load.physical_id,
                     load.force.x,
-                    load.force.y
+                    load.force.y,
+                    nodes_carga=nodes_carga,
+                    out=loads_array[offset:offset + len(nodes_carga)]
                 )
-                loads_list.append(load_array)
-
-            if loads_list:
-                loads_array = np.vstack(loads_list)
+                offset += len(nodes_carga)
 
         # Create materials array
         materials_array = self._create_materials_array()
@@ -202,13 +318,13 @@ class FEMConverter:
     def _create_materials_array(self):
         """Create materials array for SolidsPy"""
         if self.config.layers:
-            # One material per layer
-            n_materials = len(self.config.layers)
-            materials = np.zeros((n_materials, 2))
-
-            for i, layer in enumerate(self.config.layers):
-                materials[i, 0] = layer.material.E
-                materials[i, 1] = layer.material.nu
+            # One material per layer: rows of (E, nu)
+            materials = np.fromiter(
+                (v for layer in self.config.layers
+                 for v in (layer.material.E, layer.material.nu)),
+                dtype=np.float64,
+                count=2 * len(self.config.layers)
+            ).reshape(-1, 2)
 
         else:
             # Single material
@@ -221,34 +337,69 @@ class FEMConverter:
     def _save_solidspy_files(self, nodes, elements, loads, materials):
         """Save arrays to SolidsPy format files"""
         # Nodes
-        np.savetxt(
+        _write_table(
             self.output_dir / "nodes.txt",
             nodes,
-            fmt=("%d", "%.4f", "%.4f", "%d", "%d")
+            ("%d", "%.4f", "%.4f", "%d", "%d")
         )
 
         # Elements
-        fmt_elements = ["%d", "%d", "%d"] + ["%d"] * (elements.shape[1] - 3)
-        np.savetxt(
-            self.output_dir / "eles.txt",
-            elements,
-            fmt=fmt_elements
-        )
+        _write_table(self.output_dir / "eles.txt", elements, "%d")
 
         # Materials
-        np.savetxt(
-            self.output_dir / "mater.txt",
-            materials,
-            fmt="%.6e"
-        )
+        _write_table(self.output_dir / "mater.txt", materials, "%.6e")
 
         # Loads (if any)
         if loads is not None:
-            np.savetxt(
+            _write_table(
                 self.output_dir / "loads.txt",
                 loads,
-                fmt=("%d", "%.6f", "%.6f")
+                ("%d", "%.6f", "%.6f")
+            )
+
+
+def convert_batch(converters, max_parallel=None):
+    """Convert several models, overlapping GMSH runs with Python work
+
+    Up to ``max_parallel`` GMSH processes (default: CPU count) run at once.
+    While they mesh, the next models' .geo files are generated and finished
+    meshes are converted to SolidsPy files. Each converter needs its own
+    output directory, since concurrent GMSH runs would overwrite each other.
+    """
+    converters = list(converters)
+    seen = set()
+    for converter in converters:
+        output_dir = converter.output_dir.resolve()
+        if output_dir in seen:
+            raise ValueError(
+                f"Output directory {converter.output_dir} is used by more than one "
+                f"model (duplicate model_name '{converter.config.model_name}'?)"
             )
+        seen.add(output_dir)
+
+    max_parallel = max_parallel or os.cpu_count() or 1
+    pending = deque()
+
+    def finish_oldest():
+        converter, proc = pending.popleft()
+        converter._finish_gmsh(proc)
+        nodes, elements, loads, materials = converter._convert_to_solidspy()
+        converter._save_solidspy_files(nodes, elements, loads, materials)
+        print(f"✓ {converter.config.model_name}: {len(nodes)} nodes, "
+              f"{len(elements)} elements -> {converter.output_dir}")
+
+    try:
+        for converter in converters:
+            converter._generate_geo()
+            pending.append((converter, converter._start_gmsh()))
+            if len(pending) >= max_parallel:
+                finish_oldest()
+        while pending:
+            finish_oldest()
+    finally:
+        for _, proc in pending:
+            proc.kill()
+            proc.wait()  # Reap it so no zombie is left behind
 
 
 def main():
@@ -258,27 +409,37 @@ def main():
     )
     parser.add_argument(
         "config",
-        help="Path to YAML configuration file"
+        nargs="+",
+        help="Path to YAML configuration file(s)"
     )
     parser.add_argument(
         "-o", "--output-dir",
         default="./output",
-        help="Output directory (default: ./output)"
+        help="Output directory (default: ./output). With several configs, "
+             "each model is written to a subdirectory named after it."
     )
 
     args = parser.parse_args()
 
     # Load configuration
-    try:
-        config = FEMConfig.from_yaml(args.config)
-    except Exception as e:
-        print(f"Error loading configuration: {e}")
-        sys.exit(1)
+    configs = []
+    for config_path in args.config:
+        try:
+            configs.append(FEMConfig.from_yaml(config_path))
+        except Exception as e:
+            print(f"Error loading configuration {config_path}: {e}")
+            sys.exit(1)
 
     # Run conversion
     try:
-        converter = FEMConverter(config, args.output_dir)
-        converter.convert()
+        if len(configs) == 1:
+            converter = FEMConverter(configs[0], args.output_dir)
+            converter.convert()
+        else:
+            convert_batch([
+                FEMConverter(config, Path(args.output_dir) / config.model_name)
+                for config in configs
+            ])
     except Exception as e:
         print(f"Error during conversion: {e}")
         import traceback
@@ -9,13 +9,21 @@ Usage:
     streamlit run fem_gui.py
 """
 import streamlit as st
+import atexit
+import inspect
+import json
+import re
 import yaml
 import numpy as np
 from pathlib import Path
 import tempfile
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 # Add SolidsPy to path
 # Get the directory where this script is located
@@ -29,9 +37,7 @@ else:
     if os.path.exists(solidspy_path_cwd):
         sys.path.insert(0, solidspy_path_cwd)
 
-from fem_config import FEMConfig
-from fem_converter import FEMConverter
-from fem_templates import RectangularPlate, LayeredPlate, LShapeBeam, PlateWithHole
+from fem_config import FEMConfig, SafeDumper
 
 # SolidsPy imports (will be used for solver)
 SOLIDSPY_AVAILABLE = False
@@ -49,6 +55,11 @@ except Exception as e:
     SOLIDSPY_ERROR = f"Unexpected error: {str(e)}"
 
 
+# Partial reruns (st.fragment) need Streamlit >= 1.33; run in full otherwise
+_fragment = (getattr(st, "fragment", None)
+             or getattr(st, "experimental_fragment", None)
+             or (lambda func: func))
+
 # Page configuration
 st.set_page_config(
     page_title="SolidsPy Based FEM Builder",
@@ -57,8 +68,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS. Streamlit drops every element a rerun does not emit again,
+# so the stylesheet has to be sent on each run; only the text is shared.
+_CSS = """
 <style>
     .main-header {
         font-size: 4rem !important;
@@ -97,7 +109,8 @@ st.markdown("""
         border-radius: 5px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def initialize_session_state():
@@ -110,24 +123,23 @@ def initialize_session_state():
         st.session_state.conversion_complete = False
 
 
-def geometry_preview(geometry_type):
-    """Show ASCII art preview of geometry"""
-    previews = {
-        "rectangle": """
+# ASCII art previews for the geometry selector
+_GEOMETRY_PREVIEWS = {
+    "rectangle": """
         ┌─────────────────┐
         │                 │
         │   Rectangle     │
         │                 │
         └─────────────────┘
         """,
-        "layered_plate": """
+    "layered_plate": """
         ┌─────────────────┐
         │   Material 2    │  ← Upper Layer
         ├─────────────────┤
         │   Material 1    │  ← Lower Layer
         └─────────────────┘
         """,
-        "lshape": """
+    "lshape": """
         ┌───────┐
         │       │
         │       │  ← Vertical Flange
@@ -137,15 +149,19 @@ def geometry_preview(geometry_type):
         │       │  ← Horizontal Flange
         └───────┘
         """,
-        "plate_with_hole": """
+    "plate_with_hole": """
         ┌─────────────────┐
         │                 │
         │       ●         │  ← Circular Hole
         │                 │
         └─────────────────┘
         """
-    }
-    st.code(previews.get(geometry_type, ""), language="")
+}
+
+
+def geometry_preview(geometry_type):
+    """Show ASCII art preview of geometry"""
+    st.code(_GEOMETRY_PREVIEWS.get(geometry_type, ""), language="")
 
 
 def create_geometry_params(geometry_type):
@@ -190,6 +206,9 @@ def create_geometry_params(geometry_type):
     return params
 
 
+_LOCATIONS = ["left", "right", "top", "bottom"]
+
+
 def create_material_inputs(geometry_type):
     """Create material property inputs"""
     st.markdown('<p class="section-header">🔧 Material Properties</p>', unsafe_allow_html=True)
@@ -197,36 +216,47 @@ def create_material_inputs(geometry_type):
     materials = []
 
     if geometry_type == "layered_plate":
-        st.info("📚 Multi-layer configuration")
-        num_layers = st.number_input("Number of Layers", min_value=1, max_value=10, value=2, step=1)
-
-        for i in range(num_layers):
-            st.markdown(f"**Layer {i+1}**")
-            col1, col2, col3, col4 = st.columns(4)
+        import pandas as pd
 
-            with col1:
-                name = st.text_input(f"Name", value=f"layer_{i+1}", key=f"layer_name_{i}")
-            with col2:
-                y_min = st.number_input(f"Y min (m)", value=float(i/num_layers), step=0.1, key=f"y_min_{i}", format="%.3f")
-            with col3:
-                y_max = st.number_input(f"Y max (m)", value=float((i+1)/num_layers), step=0.1, key=f"y_max_{i}", format="%.3f")
-            with col4:
-                physical_id = st.number_input(f"Physical ID", value=i+1, step=1, key=f"phys_id_{i}")
-
-            col1, col2 = st.columns(2)
-            with col1:
-                E = st.number_input(f"Young's Modulus (Pa)", value=1.0e6*(i+1), format="%.2e", key=f"E_{i}")
-            with col2:
-                nu = st.number_input(f"Poisson's Ratio", min_value=0.0, max_value=0.49, value=0.3, step=0.01, key=f"nu_{i}", format="%.3f")
+        st.info("📚 Multi-layer configuration (add or remove rows to change the number of layers)")
+        num_layers = 2
+        default_layers = pd.DataFrame([
+            {
+                'name': f"layer_{i+1}",
+                'y_min': i/num_layers,
+                'y_max': (i+1)/num_layers,
+                'physical_id': i+1,
+                'E': 1.0e6*(i+1),
+                'nu': 0.3
+            }
+            for i in range(num_layers)
+        ])
+        layers = st.data_editor(
+            default_layers,
+            key="layers_editor",
+            num_rows="dynamic",
+            use_container_width=True,
+            column_config={
+                'name': st.column_config.TextColumn("Name", required=True),
+                'y_min': st.column_config.NumberColumn("Y min (m)", format="%.3f", required=True),
+                'y_max': st.column_config.NumberColumn("Y max (m)", format="%.3f", required=True),
+                'physical_id': st.column_config.NumberColumn("Physical ID", step=1, required=True),
+                'E': st.column_config.NumberColumn("Young's Modulus (Pa)", format="%.2e", required=True),
+                'nu': st.column_config.NumberColumn("Poisson's Ratio", min_value=0.0, max_value=0.49,
+                                                    format="%.3f", default=0.3, required=True),
+            }
+        )
 
-            materials.append({
-                'name': name,
-                'region': [y_min, y_max],
-                'physical_id': physical_id,
-                'E': E,
-                'nu': nu
-            })
-            st.divider()
+        # Already in the config's layer layout
+        materials = [
+            {
+                'name': str(row['name']),
+                'region': [float(row['y_min']), float(row['y_max'])],
+                'physical_id': int(row['physical_id']),
+                'material': {'E': float(row['E']), 'nu': float(row['nu'])}
+            }
+            for row in layers.dropna().to_dict('records')
+        ]
 
     else:
         # Single material
@@ -243,78 +273,78 @@ def create_material_inputs(geometry_type):
 
 def create_bc_inputs():
     """Create boundary condition inputs"""
-    st.markdown('<p class="section-header">🔒 Boundary Conditions</p>', unsafe_allow_html=True)
-
-    num_bcs = st.number_input("Number of Boundary Conditions", min_value=0, max_value=10, value=2, step=1)
+    import pandas as pd
 
-    bcs = []
-    for i in range(num_bcs):
-        st.markdown(f"**BC {i+1}**")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            name = st.text_input("Name", value=f"bc_{i+1}", key=f"bc_name_{i}")
-            location = st.selectbox(
-                "Location",
-                ["left", "right", "top", "bottom"],
-                key=f"bc_location_{i}"
-            )
+    st.markdown('<p class="section-header">🔒 Boundary Conditions</p>', unsafe_allow_html=True)
 
-        with col2:
-            physical_id = st.number_input("Physical ID", value=100+i, step=1, key=f"bc_phys_id_{i}")
-            x_constraint = st.selectbox("X Constraint", ["free", "fixed"], key=f"bc_x_{i}")
+    default_bcs = pd.DataFrame([
+        {'name': f"bc_{i+1}", 'location': "left", 'physical_id': 100+i, 'x': "free", 'y': "free"}
+        for i in range(2)
+    ])
+    edited = st.data_editor(
+        default_bcs,
+        key="bc_editor",
+        num_rows="dynamic",
+        use_container_width=True,
+        column_config={
+            'name': st.column_config.TextColumn("Name", required=True),
+            'location': st.column_config.SelectboxColumn("Location", options=_LOCATIONS,
+                                                         default="left", required=True),
+            'physical_id': st.column_config.NumberColumn("Physical ID", step=1, required=True),
+            'x': st.column_config.SelectboxColumn("X Constraint", options=["free", "fixed"],
+                                                  default="free", required=True),
+            'y': st.column_config.SelectboxColumn("Y Constraint", options=["free", "fixed"],
+                                                  default="free", required=True),
+        }
+    )
 
-        with col3:
-            st.write("")  # Spacer
-            st.write("")  # Spacer
-            y_constraint = st.selectbox("Y Constraint", ["free", "fixed"], key=f"bc_y_{i}")
-
-        bcs.append({
-            'name': name,
-            'location': location,
-            'physical_id': physical_id,
-            'constraints': {'x': x_constraint, 'y': y_constraint}
-        })
-        st.divider()
+    bcs = [
+        {
+            'name': str(row['name']),
+            'location': row['location'],
+            'physical_id': int(row['physical_id']),
+            'constraints': {'x': row['x'], 'y': row['y']}
+        }
+        for row in edited.dropna().to_dict('records')
+    ]
 
     return bcs
 
 
 def create_load_inputs():
     """Create load inputs"""
-    st.markdown('<p class="section-header">⚡ Loads</p>', unsafe_allow_html=True)
-
-    num_loads = st.number_input("Number of Loads", min_value=0, max_value=10, value=1, step=1)
+    import pandas as pd
 
-    loads = []
-    for i in range(num_loads):
-        st.markdown(f"**Load {i+1}**")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            name = st.text_input("Name", value=f"load_{i+1}", key=f"load_name_{i}")
-            location = st.selectbox(
-                "Location",
-                ["left", "right", "top", "bottom"],
-                key=f"load_location_{i}"
-            )
+    st.markdown('<p class="section-header">⚡ Loads</p>', unsafe_allow_html=True)
 
-        with col2:
-            physical_id = st.number_input("Physical ID", value=200+i, step=1, key=f"load_phys_id_{i}")
-            fx = st.number_input("Force X (N)", value=0.0, format="%.2f", key=f"load_fx_{i}")
+    default_loads = pd.DataFrame([
+        {'name': "load_1", 'location': "left", 'physical_id': 200, 'fx': 0.0, 'fy': -1000.0}
+    ])
+    edited = st.data_editor(
+        default_loads,
+        key="load_editor",
+        num_rows="dynamic",
+        use_container_width=True,
+        column_config={
+            'name': st.column_config.TextColumn("Name", required=True),
+            'location': st.column_config.SelectboxColumn("Location", options=_LOCATIONS,
+                                                         default="left", required=True),
+            'physical_id': st.column_config.NumberColumn("Physical ID", step=1, required=True),
+            'fx': st.column_config.NumberColumn("Force X (N)", format="%.2f", default=0.0, required=True),
+            'fy': st.column_config.NumberColumn("Force Y (N)", format="%.2f", default=-1000.0, required=True),
+        }
+    )
 
-        with col3:
-            st.write("")  # Spacer
-            fy = st.number_input("Force Y (N)", value=-1000.0, format="%.2f", key=f"load_fy_{i}")
-
-        loads.append({
-            'name': name,
-            'location': location,
-            'physical_id': physical_id,
-            'force': {'x': fx, 'y': fy},
+    loads = [
+        {
+            'name': str(row['name']),
+            'location': row['location'],
+            'physical_id': int(row['physical_id']),
+            'force': {'x': float(row['fx']), 'y': float(row['fy'])},
             'distribution': 'uniform'
-        })
-        st.divider()
+        }
+        for row in edited.dropna().to_dict('records')
+    ]
 
     return loads
 
@@ -330,10 +360,12 @@ def create_mesh_inputs():
         element_type = st.selectbox("Element Type", ["triangle", "triangle6", "quad"], index=0)
 
     with col2:
+        # Both widgets are always shown: inside a form the checkbox cannot
+        # reveal the algorithm input until the form is submitted
         use_algorithm = st.checkbox("Specify Mesh Algorithm", value=False)
-        algorithm = None
-        if use_algorithm:
-            algorithm = st.number_input("Algorithm (1-9)", min_value=1, max_value=9, value=6, step=1)
+        algorithm = st.number_input("Algorithm (1-9)", min_value=1, max_value=9, value=6, step=1)
+        if not use_algorithm:
+            algorithm = None
 
     return {
         'size': mesh_size,
@@ -356,15 +388,7 @@ def build_yaml_config(model_name, description, geometry_type, geom_params, mater
 
     # Add materials or layers
     if geometry_type == "layered_plate":
-        config['layers'] = [
-            {
-                'name': mat['name'],
-                'region': mat['region'],
-                'physical_id': mat['physical_id'],
-                'material': {'E': mat['E'], 'nu': mat['nu']}
-            }
-            for mat in materials
-        ]
+        config['layers'] = materials
     else:
         config['material'] = materials
 
@@ -379,8 +403,401 @@ def build_yaml_config(model_name, description, geometry_type, geom_params, mater
     return config
 
 
-def calculate_reaction_forces(nodes_array, elements_array, materials_array,
-                             UC, loads_array, DME, IBC, neq):
+def _config_key(config_dict):
+    """JSON string used as the cache key for a config dict
+
+    Keys keep their insertion order: the same string is parsed back by
+    ``_serialize_config``, whose YAML follows that order.
+    """
+    return json.dumps(config_dict, default=str)
+
+
+@st.cache_data(show_spinner=False)
+def _serialize_config(config_json):
+    """YAML text for a config given as a JSON string (cached across reruns)"""
+    return yaml.dump(json.loads(config_json), Dumper=SafeDumper,
+                     default_flow_style=False, sort_keys=False)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _validate_config(config_json):
+    """Validate a config given as a JSON string (cached across reruns)
+
+    Cached as a resource so a hit hands back the validated model itself
+    instead of unpickling a copy; callers must not modify it.
+    """
+    return FEMConfig.from_json(config_json)
+
+
+@st.cache_resource(show_spinner=False)
+def _conversion_cache_dir():
+    """Private per-process folder for conversion outputs, removed at exit
+
+    Conversion outputs stay on disk here, so saving copies files instead of
+    round-tripping their contents through Python strings.
+    """
+    path = Path(tempfile.mkdtemp(prefix="fem_cache_"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def _release_conversion(result):
+    """Delete the output folder of a conversion evicted from its cache"""
+    output_files, _ = result
+    shutil.rmtree(output_files['nodes'].parent, ignore_errors=True)
+
+
+# Evicted conversions take their folder with them (on_release needs a
+# recent Streamlit); the whole cache folder is removed at exit regardless
+_RELEASE_CONVERSION = (
+    {'on_release': _release_conversion}
+    if 'on_release' in inspect.signature(st.cache_resource.__call__).parameters
+    else {}
+)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32, **_RELEASE_CONVERSION)
+def _run_conversion(config_json):
+    """Run GMSH and the SolidsPy conversion for a config (cached)
+
+    The files are written to a per-config folder under
+    ``_conversion_cache_dir()``. Returns their paths (None for files that were
+    not produced) and the arrays needed by the solver, so converting an
+    unchanged model again does not re-run GMSH. The result is shared by
+    all sessions and must not be modified.
+    """
+    # Imported on first conversion: pulls in meshio and the geo generator
+    from fem_converter import FEMConverter
+
+    config = _validate_config(config_json)
+    out_dir = _conversion_cache_dir() / hashlib.blake2b(
+        config_json.encode(), digest_size=16
+    ).hexdigest()
+    converter = FEMConverter(config, output_dir=str(out_dir))
+    converter.convert()
+
+    yaml_file = out_dir / f"{config.model_name}.yaml"
+    yaml_file.write_text(_serialize_config(config_json))
+    loads_file = out_dir / "loads.txt"
+
+    output_files = {
+        'yaml': yaml_file,
+        'geo': converter.geo_file if converter.geo_file.exists() else None,
+        'msh': converter.msh_file if converter.msh_file.exists() else None,
+        'nodes': out_dir / "nodes.txt",
+        'eles': out_dir / "eles.txt",
+        'mater': out_dir / "mater.txt",
+        'loads': loads_file if loads_file.exists() else None
+    }
+
+    # Arrays for the solver
+    output_arrays = {
+        'nodes': np.loadtxt(str(output_files['nodes']), ndmin=2),
+        'elements': np.loadtxt(str(output_files['eles']), ndmin=2, dtype=np.int32),
+        'materials': np.loadtxt(str(output_files['mater']), ndmin=2),
+        'loads': np.loadtxt(str(loads_file), ndmin=2) if output_files['loads'] else None
+    }
+    return output_files, output_arrays
+
+
+def _builder_outputs():
+    """Output file paths and solver arrays of the model builder's last conversion
+
+    Session state only keeps the converted config; the arrays live once in
+    the ``_run_conversion`` resource cache and the files on disk.
+    """
+    config_json = st.session_state.builder_output_config
+    output_files, output_arrays = _run_conversion(config_json)
+    if not output_files['nodes'].exists():
+        # Cache folder was cleaned up behind our back: convert again
+        _run_conversion.clear(config_json)
+        output_files, output_arrays = _run_conversion(config_json)
+    return output_files, output_arrays
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _mesh_tables(msh_digest, _msh_path):
+    """Node table and physical-group indexes of a .msh file (cached)
+
+    Keyed on the digest of the file's bytes: changing only BCs or loads in
+    the GEO loader re-meshes into a new folder, but GMSH normally writes
+    the same bytes, so parsing and indexing are reused. Returns the
+    SolidsPy node table (without BCs), the ``(cell_type, physical_id)``
+    cell index and the physical line -> nodes index. They are shared and
+    must not be modified; copy the node table before applying BCs.
+    """
+    import meshio
+    import preprocesor as msh_proc
+    from fem_converter import _index_cells, _index_line_nodes
+
+    mesh = meshio.read(str(_msh_path))
+    nodes_array = msh_proc.node_writer(mesh.points, mesh.point_data)
+    cell_index = _index_cells(mesh.cells, mesh.cell_data)
+    return nodes_array, cell_index, _index_line_nodes(cell_index)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32, **_RELEASE_CONVERSION)
+def _run_geo_conversion(run_json):
+    """Mesh an uploaded GEO file and convert it to SolidsPy format (cached)
+
+    ``run_json`` is a JSON object holding the model name, GEO text,
+    materials, BCs, loads and element type. Like ``_run_conversion``, the
+    files go to a per-input folder under ``_conversion_cache_dir()`` and the
+    returned paths and solver arrays are shared and must not be modified.
+    """
+    run = json.loads(run_json)
+    model_name = run['model_name']
+    materials, bcs, loads = run['materials'], run['bcs'], run['loads']
+    element_type = run['element_type']
+
+    out_dir = _conversion_cache_dir() / "geo" / hashlib.blake2b(
+        run_json.encode(), digest_size=16
+    ).hexdigest()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Save GEO file: encoded once and written as-is (no text-mode newline
+    # translation); Save All copies this file instead of re-encoding
+    geo_path = out_dir / f"{model_name}.geo"
+    geo_path.write_bytes(run['geo_content'].encode('utf-8'))
+
+    # Run GMSH
+    from fem_converter import (
+        FEMConverter, _ele_writer, _line_nodes, _loading, _surface_cells,
+        _write_table
+    )
+    converter = FEMConverter.__new__(FEMConverter)
+    gmsh_exe = converter._find_gmsh()
+
+    if not gmsh_exe:
+        raise FileNotFoundError("GMSH executable not found")
+
+    # Binary MSH is smaller to write, hash and parse than the ASCII format;
+    # -nt lets GMSH mesh independent surfaces on all cores. GMSH runs in the
+    # background while the mesh-independent tables are prepared.
+    msh_path = out_dir / f"{model_name}.msh"
+    proc = subprocess.Popen(
+        [gmsh_exe, str(geo_path), "-2", "-bin", "-nopopup",
+         "-nt", str(os.cpu_count() or 1), "-o", str(msh_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    # Map element type to SolidsPy element ID
+    ele_type_map = {
+        'triangle': 3,
+        'quad': 2
+    }
+    ele_type_id = ele_type_map[element_type]
+
+    # Create materials array (only E and nu for SolidsPy)
+    materials_array = np.fromiter(
+        (v for mat in materials for v in (mat['E'], mat['nu'])),
+        dtype=np.float64,
+        count=2 * len(materials)
+    ).reshape(-1, 2)
+
+    # Fold BCs and loads that share a physical line so each line is applied
+    # once: a direction is fixed if any BC fixes it, and forces add up
+    line_fixed = {}
+    for bc in bcs:
+        fixed = line_fixed.setdefault(bc['physical_id'], {'x': False, 'y': False})
+        for axis in ('x', 'y'):
+            fixed[axis] |= bc['constraints'][axis] == "fixed"
+
+    line_forces = {}
+    for load in loads:
+        fx, fy = line_forces.get(load['physical_id'], (0.0, 0.0))
+        line_forces[load['physical_id']] = (fx + load['force']['x'], fy + load['force']['y'])
+
+    _, stderr = proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"GMSH failed: {stderr}")
+
+    # Read and index the mesh (done once per distinct GMSH output); cells
+    # are indexed by physical tag, as in FEMConverter
+    msh_digest = hashlib.blake2b(msh_path.read_bytes(), digest_size=16).hexdigest()
+    base_nodes, cell_index, line_index = _mesh_tables(msh_digest, msh_path)
+
+    # Convert nodes
+    nodes_array = base_nodes.copy()
+
+    # Convert elements
+    # Size the element table up front and fill each material's rows in place
+    layer_cells = [_surface_cells(cell_index, element_type, mat['physical_id'])
+                   for mat in materials]
+    if not layer_cells:
+        raise ValueError("No elements extracted. Check physical surface IDs.")
+
+    elements_array = np.empty(
+        (sum(len(eles) for eles in layer_cells), 3 + layer_cells[0].shape[1]),
+        dtype=np.int32
+    )
+    nini = 0
+    for mat_idx, mat in enumerate(materials):
+        nini, _ = _ele_writer(
+            cell_index,
+            element_type,
+            mat['physical_id'],  # Physical surface ID from GMSH
+            ele_type_id,
+            mat_idx,              # Material tag = row index in mater.txt (0, 1, 2, ...)
+            nini,
+            out=elements_array
+        )
+
+    # Apply boundary conditions from the nodes of each physical line
+    for line_id, fixed in line_fixed.items():
+        bc_nodes = _line_nodes(line_index, line_id)
+        nodes_array[bc_nodes, 3] = -1 if fixed['x'] else 0
+        nodes_array[bc_nodes, 4] = -1 if fixed['y'] else 0
+
+    # Apply loads
+    loads_array = None
+    if line_forces:
+        load_nodes = [_line_nodes(line_index, line_id) for line_id in line_forces]
+        loads_array = np.empty((sum(len(n) for n in load_nodes), 3))
+        offset = 0
+        for (line_id, (fx, fy)), nodes_carga in zip(line_forces.items(), load_nodes):
+            _loading(
+                line_index,
+                line_id,
+                fx,
+                fy,
+                nodes_carga=nodes_carga,
+                out=loads_array[offset:offset + len(nodes_carga)]
+            )
+            offset += len(nodes_carga)
+
+    # Write output files next to the mesh (one formatted write per table)
+    nodes_file = out_dir / "nodes.txt"
+    _write_table(nodes_file, nodes_array, ("%d", "%.4f", "%.4f", "%d", "%d"))
+
+    eles_file = out_dir / "eles.txt"
+    _write_table(eles_file, elements_array, "%d")
+
+    mater_file = out_dir / "mater.txt"
+    _write_table(mater_file, materials_array, "%.6e")
+
+    loads_file = None
+    if loads_array is not None:
+        loads_file = out_dir / "loads.txt"
+        _write_table(loads_file, loads_array, ("%d", "%.6f", "%.6f"))
+
+    output_paths = {
+        'geo': geo_path,
+        'msh': msh_path,
+        'nodes': nodes_file,
+        'eles': eles_file,
+        'mater': mater_file,
+        'loads': loads_file
+    }
+
+    output_arrays = {
+        'nodes': nodes_array,
+        'elements': elements_array,
+        'materials': materials_array,
+        'loads': loads_array
+    }
+    return output_paths, output_arrays
+
+
+def _geo_outputs():
+    """Output file paths and solver arrays of the GEO loader's last conversion
+
+    Like ``_builder_outputs``: session state only keeps the conversion
+    inputs, and a cache folder that was cleaned up is converted again.
+    """
+    run_json = st.session_state.geo_run_json
+    output_paths, output_arrays = _run_geo_conversion(run_json)
+    if not output_paths['nodes'].exists():
+        # Cache folder was cleaned up behind our back: convert again
+        _run_geo_conversion.clear(run_json)
+        output_paths, output_arrays = _run_geo_conversion(run_json)
+    return output_paths, output_arrays
+
+
+# Lines shown in st.code previews; the full files are available as downloads
+PREVIEW_LINES = 200
+
+
+def _preview_text(text, max_lines=PREVIEW_LINES):
+    """First ``max_lines`` lines of ``text``, with a marker if it was cut"""
+    lines = text.split('\n', max_lines)
+    if len(lines) <= max_lines or not lines[max_lines]:
+        return text
+    return '\n'.join(lines[:max_lines]) + '\n... (preview truncated)'
+
+
+def _read_preview(path, max_lines=PREVIEW_LINES):
+    """First ``max_lines`` lines of a text file, for st.code previews"""
+    with open(path, 'r') as f:
+        head = ''.join(islice(f, max_lines + 1))
+    return _preview_text(head, max_lines)
+
+
+def _plot_geometry(nodes, elements):
+    """Coordinates, zero z-plane and triangles shared by the result plots
+
+    Built once per solve so the plots don't each slice the node table and
+    re-cast the connectivity. Stored as contiguous float32/int32 arrays,
+    which Plotly serializes with fewer digits than float64.
+    """
+    x = _display_array(nodes[:, 1])
+    return {
+        'x': x,
+        'y': _display_array(nodes[:, 2]),
+        'z0': np.zeros_like(x),  # 2D mesh
+        'triangles': np.ascontiguousarray(elements[:, 3:6], dtype=np.int32)
+    }
+
+
+def _display_array(values):
+    """Contiguous float32 copy of plotted values (display precision only)"""
+    return np.ascontiguousarray(values, dtype=np.float32)
+
+
+def _array_hash(array):
+    """Cache key of a NumPy array for ``st.cache_data(hash_funcs=...)``
+
+    Streamlit samples arrays of 500k+ values when hashing them, so an
+    edit elsewhere in a large mesh could hit a stale entry; this digests
+    every byte.
+    """
+    return (array.shape, array.dtype.str,
+            hashlib.blake2b(np.ascontiguousarray(array).tobytes(), digest_size=16).hexdigest())
+
+
+def _scatter_loads(loads_array, n_dof):
+    """Applied force vector over all nodal DOFs from a loads array
+
+    Repeated nodes keep their last row, as in ``ass.loadasem``, so the
+    applied forces match the right-hand side that was actually solved.
+    """
+    F_applied = np.zeros(n_dof)
+    load_nodes = loads_array[:, 0].astype(np.intp)
+    F_applied[2*load_nodes] = loads_array[:, 1]      # Fx
+    F_applied[2*load_nodes + 1] = loads_array[:, 2]  # Fy
+    return F_applied
+
+
+def _extract_reactions(nodes_array, F_reaction):
+    """[node_id, Rx, Ry] rows of the nodes with at least one fixed DOF"""
+    fixed_x = nodes_array[:, 3] == -1
+    fixed_y = nodes_array[:, 4] == -1
+    constrained = fixed_x | fixed_y
+    return np.column_stack([
+        nodes_array[constrained, 0],
+        np.where(fixed_x, F_reaction[:, 0], 0.0)[constrained],
+        np.where(fixed_y, F_reaction[:, 1], 0.0)[constrained]
+    ])
+
+
+def _max_abs(array):
+    """Largest absolute value of an array, without an ``np.abs`` temporary"""
+    return max(array.max(), -array.min())
+
+
+def calculate_reaction_forces(nodes_array, KG_full, UC, loads_array):
     """
     Calculate reaction forces at constrained nodes.
 
@@ -388,70 +805,75 @@ def calculate_reaction_forces(nodes_array, elements_array, materials_array,
     ----------
     nodes_array : ndarray
         Nodes array with boundary conditions
-    elements_array : ndarray
-        Elements array
-    materials_array : ndarray
-        Materials array
+    KG_full : sparse matrix
+        Stiffness matrix over all nodal DOFs, constrained ones included
+        (see ``_full_stiffness``)
     UC : ndarray
         Complete displacement vector
     loads_array : ndarray
         Applied loads array
-    DME : ndarray
-        Assembly operator
-    IBC : ndarray
-        Boundary conditions indicator
-    neq : int
-        Number of equations
 
     Returns
     -------
     reactions : ndarray
         Reaction forces array (N x 3): [node_id, Rx, Ry]
     """
-    # Total number of DOFs
-    n_nodes = len(nodes_array)
-    n_dof = 2 * n_nodes
-
-    # Assemble full stiffness matrix (including constrained DOFs)
-    # We need the full matrix to compute reactions
-    KG_full = ass.assembler(elements_array, materials_array, nodes_array, n_dof, DME)
-
-    # Flatten displacement vector
-    U_full = UC.flatten()
+    n_dof = 2 * len(nodes_array)
 
-    # Calculate internal forces: F_internal = K * U
-    F_internal = KG_full @ U_full
+    # Calculate internal forces: F_internal = K * U (sparse matvec)
+    F_internal = KG_full @ UC.ravel()
 
-    # Create applied loads vector
-    F_applied = np.zeros(n_dof)
+    # Reaction forces = Internal forces - Applied forces, subtracted in
+    # place (the matvec result is a fresh array; unloaded models skip it)
+    F_reaction = F_internal
     if loads_array is not None and len(loads_array) > 0:
-        for load in loads_array:
-            node_id = int(load[0])
-            F_applied[2*node_id] = load[1]      # Fx
-            F_applied[2*node_id + 1] = load[2]  # Fy
-
-    # Reaction forces = Internal forces - Applied forces
-    F_reaction = F_internal - F_applied
+        F_reaction -= _scatter_loads(loads_array, n_dof)
+    F_reaction = F_reaction.reshape(-1, 2)
 
     # Extract reactions at constrained nodes only
-    reaction_list = []
-    for i, node in enumerate(nodes_array):
-        node_id = int(node[0])
-        bc_x = int(node[3])
-        bc_y = int(node[4])
-
-        # If either DOF is constrained, this node has reactions
-        if bc_x == -1 or bc_y == -1:
-            Rx = F_reaction[2*i] if bc_x == -1 else 0.0
-            Ry = F_reaction[2*i + 1] if bc_y == -1 else 0.0
-            reaction_list.append([node_id, Rx, Ry])
-
-    if reaction_list:
-        return np.array(reaction_list)
+    reactions = _extract_reactions(nodes_array, F_reaction)
+    if len(reactions) > 0:
+        return reactions
     else:
         return np.array([[0, 0, 0]])  # No reactions
 
 
+def _full_stiffness(nodes_array, elements_array, materials_array):
+    """Global stiffness matrix over all nodal DOFs (sparse CSR)
+
+    Assembled with every DOF treated as free, so DOF ``2*i + k`` of node
+    ``i`` is row ``2*i + k``. Reactions need the rows of the constrained
+    DOFs, which the solver's reduced matrix drops.
+    """
+    free_nodes = nodes_array.copy()
+    free_nodes[:, 3:5] = 0
+    DME_full, _, n_dof = ass.DME(free_nodes, elements_array)
+    return ass.assembler(elements_array, materials_array, nodes_array, n_dof, DME_full)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4, hash_funcs={np.ndarray: _array_hash})
+def _factorize(nodes_array, elements_array, materials_array):
+    """Factorized stiffness system of a model (cached)
+
+    Depends only on the mesh, BCs and materials, so solving the same model
+    under different loads reuses the LU factor and only back-substitutes.
+    Returns ``(lu, IBC, neq, KG_full)``: the SuperLU factor of the reduced
+    stiffness matrix, the equation numbering, the number of equations and
+    the full-DOF stiffness for reactions. Shared; must not be modified.
+
+    The stiffness is assembled once, over all DOFs; the reduced matrix is
+    its free rows and columns, which ``eqcounter`` numbers in DOF order.
+    """
+    from scipy.sparse.linalg import splu
+
+    neq, IBC = ass.eqcounter(nodes_array)
+    KG_full = _full_stiffness(nodes_array, elements_array, materials_array)
+    free = IBC.ravel() >= 0
+    KG = KG_full[free][:, free]
+    return splu(KG.tocsc()), IBC, neq, KG_full
+
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs={np.ndarray: _array_hash})
 def run_solidspy_solver(nodes_array, elements_array, materials_array, loads_array):
     """
     Run SolidsPy FEA solver on the generated mesh.
@@ -477,9 +899,13 @@ def run_solidspy_solver(nodes_array, elements_array, materials_array, loads_arra
         - 'stresses': ndarray (stresses at nodes)
         - 'nodes': ndarray (nodes for plotting)
         - 'elements': ndarray (elements for plotting)
+        - 'plot_geometry': dict (see ``_plot_geometry``)
         - 'max_displacement': float
         - 'max_stress': float
         - 'error': str (if failed)
+
+    Results are cached on the content of the input arrays, so solving the
+    same model again (e.g. after switching pages) is a cache hit.
     """
     if not SOLIDSPY_AVAILABLE:
         return {
@@ -488,19 +914,17 @@ def run_solidspy_solver(nodes_array, elements_array, materials_array, loads_arra
         }
 
     try:
-        # Step 1: Create assembly operator
-        DME, IBC, neq = ass.DME(nodes_array, elements_array)
+        # Steps 1-2: Assembly operator and factorized global stiffness
+        # matrix (cached per mesh, BCs and materials)
+        lu, IBC, neq, KG_full = _factorize(nodes_array, elements_array, materials_array)
 
-        # Step 2: Assemble global stiffness matrix
-        KG = ass.assembler(elements_array, materials_array, nodes_array, neq, DME)
-
-        # Step 3: Assemble loads vector
+        # Step 3: Assemble loads vector (no rows if the model is unloaded)
         if loads_array is None or len(loads_array) == 0:
-            loads_array = np.zeros((1, 3))
+            loads_array = np.empty((0, 3))
         RHSG = ass.loadasem(loads_array, IBC, neq)
 
-        # Step 4: Solve system of equations
-        UG = sol.static_sol(KG, RHSG)
+        # Step 4: Solve system of equations (back-substitution only)
+        UG = lu.solve(RHSG)
 
         # Step 5: Complete displacements vector
         UC = pos.complete_disp(IBC, nodes_array, UG)
@@ -510,12 +934,11 @@ def run_solidspy_solver(nodes_array, elements_array, materials_array, loads_arra
 
         # Step 7: Calculate reaction forces at constrained nodes
         # Reaction forces = K * U - F_applied at constrained DOFs
-        reactions = calculate_reaction_forces(nodes_array, elements_array, materials_array,
-                                             UC, loads_array, DME, IBC, neq)
+        reactions = calculate_reaction_forces(nodes_array, KG_full, UC, loads_array)
 
         # Calculate summary statistics
-        max_disp = np.max(np.abs(UC))
-        max_stress = np.max(np.abs(S_nodes))
+        max_disp = _max_abs(UC)
+        max_stress = _max_abs(S_nodes)
 
         return {
             'success': True,
@@ -524,6 +947,7 @@ def run_solidspy_solver(nodes_array, elements_array, materials_array, loads_arra
             'stresses': S_nodes,
             'nodes': nodes_array,
             'elements': elements_array,
+            'plot_geometry': _plot_geometry(nodes_array, elements_array),
             'reactions': reactions,
             'loads_array': loads_array,
             'max_displacement': max_disp,
@@ -538,16 +962,43 @@ def run_solidspy_solver(nodes_array, elements_array, materials_array, loads_arra
         }
 
 
-def create_interactive_contour_plot(nodes, elements, field_values, title, colorbar_title, height=700):
+# Above this many nodes the contour meshes carry no per-vertex hover text;
+# a sparse probe layer of about HOVER_PROBES nodes shows values instead
+HOVER_NODE_LIMIT = 20_000
+HOVER_PROBES = 5_000
+
+
+def _hover_probe(go, geometry, field_values=None):
+    """Invisible Scatter3d on every k-th node that carries the hover text"""
+    stride = max(1, len(geometry['x']) // HOVER_PROBES)
+    hovertemplate = '<b>X</b>: %{x:.3f}<br><b>Y</b>: %{y:.3f}<br><extra></extra>'
+    if field_values is not None:
+        hovertemplate = '<b>Value</b>: %{customdata:.3e}<br>' + hovertemplate
+        field_values = _display_array(field_values[::stride])
+    return go.Scatter3d(
+        x=geometry['x'][::stride],
+        y=geometry['y'][::stride],
+        z=geometry['z0'][::stride],
+        mode='markers',
+        marker=dict(size=3, opacity=0),
+        customdata=field_values,
+        hovertemplate=hovertemplate,
+        showlegend=False
+    )
+
+
+# The result plots are cached on their inputs: reruns that leave a plot's
+# data and options unchanged (e.g. moving an unrelated slider) reuse the
+# built figure instead of reconstructing its mesh traces.
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={np.ndarray: _array_hash})
+def create_interactive_contour_plot(geometry, field_values, title, colorbar_title, height=700):
     """
     Create an interactive Plotly contour plot for FEM results.
 
     Parameters
     ----------
-    nodes : ndarray
-        Nodes array with coordinates
-    elements : ndarray
-        Elements array with connectivity
+    geometry : dict
+        Mesh coordinates and triangles from ``_plot_geometry``
     field_values : ndarray
         Field values at nodes (1D array)
     title : str
@@ -564,24 +1015,19 @@ def create_interactive_contour_plot(nodes, elements, field_values, title, colorb
     """
     import plotly.graph_objects as go
 
-    # Extract coordinates
-    x = nodes[:, 1]
-    y = nodes[:, 2]
-
-    # Get element connectivity (triangles)
-    # Elements format: [id, type, mat_id, node1, node2, node3, ...]
-    # For triangles: columns 3, 4, 5 are the node indices
-    triangles = elements[:, 3:6].astype(int)
+    # Coordinates and triangle connectivity (shared by all plots of a solve)
+    x, y, triangles = geometry['x'], geometry['y'], geometry['triangles']
+    sparse_hover = len(x) > HOVER_NODE_LIMIT
 
     # Create triangulation-based contour plot
     fig = go.Figure(data=go.Mesh3d(
         x=x,
         y=y,
-        z=np.zeros_like(x),  # 2D mesh
+        z=geometry['z0'],  # 2D mesh
         i=triangles[:, 0],
         j=triangles[:, 1],
         k=triangles[:, 2],
-        intensity=field_values,
+        intensity=_display_array(field_values),
         colorscale='RdYlBu_r',
         colorbar=dict(
             title=dict(text=colorbar_title, side='right'),
@@ -589,12 +1035,17 @@ def create_interactive_contour_plot(nodes, elements, field_values, title, colorb
             thickness=20,
             len=0.7
         ),
-        hovertemplate='<b>Value</b>: %{intensity:.3e}<br>' +
-                      '<b>X</b>: %{x:.3f}<br>' +
-                      '<b>Y</b>: %{y:.3f}<br>' +
-                      '<extra></extra>',
+        hovertemplate=None if sparse_hover else (
+            '<b>Value</b>: %{intensity:.3e}<br>' +
+            '<b>X</b>: %{x:.3f}<br>' +
+            '<b>Y</b>: %{y:.3f}<br>' +
+            '<extra></extra>'
+        ),
+        hoverinfo='skip' if sparse_hover else None,
         showscale=True
     ))
+    if sparse_hover:
+        fig.add_trace(_hover_probe(go, geometry, field_values))
 
     fig.update_layout(
         title=dict(text=title, x=0.5, xanchor='center'),
@@ -618,17 +1069,28 @@ def create_interactive_contour_plot(nodes, elements, field_values, title, colorb
     return fig
 
 
-def create_filtered_contour_plot(nodes, elements, field_values, title, colorbar_title, threshold=None, threshold_type='above', height=700):
+@st.cache_resource(show_spinner=False, max_entries=16, hash_funcs={np.ndarray: _array_hash})
+def _field_extremes(triangles, field_values):
+    """Sorted nodal values and per-triangle max/min of a field (cached)
+
+    Moving a threshold slider then costs a binary search for the node count
+    and one comparison per triangle, instead of re-gathering the corner
+    values of every triangle. Shared; must not be modified.
+    """
+    corner_values = field_values[triangles]
+    return np.sort(field_values), corner_values.max(axis=1), corner_values.min(axis=1)
+
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs={np.ndarray: _array_hash})
+def create_filtered_contour_plot(geometry, field_values, title, colorbar_title, threshold=None, threshold_type='above', height=700):
     """
     Create an interactive Plotly contour plot with binary threshold filtering.
     Regions exceeding threshold shown in red, safe regions in gray.
 
     Parameters
     ----------
-    nodes : ndarray
-        Nodes array with coordinates
-    elements : ndarray
-        Elements array with connectivity
+    geometry : dict
+        Mesh coordinates and triangles from ``_plot_geometry``
     field_values : ndarray
         Field values at nodes (1D array)
     title : str
@@ -651,53 +1113,48 @@ def create_filtered_contour_plot(nodes, elements, field_values, title, colorbar_
     """
     import plotly.graph_objects as go
 
-    # Extract coordinates
-    x = nodes[:, 1]
-    y = nodes[:, 2]
-
-    # Get element connectivity (triangles)
-    triangles = elements[:, 3:6].astype(int)
+    # Coordinates and triangle connectivity (shared by all plots of a solve)
+    x, y, triangles = geometry['x'], geometry['y'], geometry['triangles']
+    sparse_hover = len(x) > HOVER_NODE_LIMIT
 
     # Apply binary threshold filtering
     stats = {}
 
     if threshold is not None:
+        sorted_field, tri_max, tri_min = _field_extremes(triangles, field_values)
         if threshold_type == 'above':
-            mask = field_values >= threshold
+            tri_mask = tri_max >= threshold
 
-            stats['exceeding_nodes'] = np.sum(mask)
+            stats['exceeding_nodes'] = len(sorted_field) - np.searchsorted(sorted_field, threshold)
             stats['total_nodes'] = len(field_values)
             stats['percentage'] = (stats['exceeding_nodes'] / stats['total_nodes']) * 100
             stats['threshold'] = threshold
             stats['type'] = 'above'
         else:  # 'below'
-            mask = field_values <= threshold
+            tri_mask = tri_min <= threshold
 
-            stats['exceeding_nodes'] = np.sum(mask)
+            stats['exceeding_nodes'] = np.searchsorted(sorted_field, threshold, side='right')
             stats['total_nodes'] = len(field_values)
             stats['percentage'] = (stats['exceeding_nodes'] / stats['total_nodes']) * 100
             stats['threshold'] = threshold
             stats['type'] = 'below'
 
-        # Compute per-triangle status (if ANY vertex exceeds, mark the triangle as exceeding)
-        triangle_exceeds = []
-        for tri in triangles:
-            # Check if any vertex of this triangle exceeds the threshold
-            if np.any(mask[tri]):
-                triangle_exceeds.append('red')
-            else:
-                triangle_exceeds.append('lightgray')
+        # Per-triangle status (if ANY vertex exceeds, mark the triangle as exceeding)
+        triangle_exceeds = np.where(tri_mask, 'red', 'lightgray').tolist()
 
         # Create mesh with per-face coloring
         fig = go.Figure(data=go.Mesh3d(
             x=x,
             y=y,
-            z=np.zeros_like(x),
+            z=geometry['z0'],
             i=triangles[:, 0],
             j=triangles[:, 1],
             k=triangles[:, 2],
             facecolor=triangle_exceeds,  # Use facecolor for per-triangle coloring
-            hovertemplate='<b>X</b>: %{x:.3f}<br><b>Y</b>: %{y:.3f}<br><extra></extra>',
+            hovertemplate=None if sparse_hover else (
+                '<b>X</b>: %{x:.3f}<br><b>Y</b>: %{y:.3f}<br><extra></extra>'
+            ),
+            hoverinfo='skip' if sparse_hover else None,
             showscale=False,  # No colorbar needed for categorical colors
             flatshading=True  # No interpolation between vertices
         ))
@@ -726,11 +1183,11 @@ def create_filtered_contour_plot(nodes, elements, field_values, title, colorbar_
         fig = go.Figure(data=go.Mesh3d(
             x=x,
             y=y,
-            z=np.zeros_like(x),
+            z=geometry['z0'],
             i=triangles[:, 0],
             j=triangles[:, 1],
             k=triangles[:, 2],
-            intensity=field_values,
+            intensity=_display_array(field_values),
             colorscale='RdYlBu_r',
             colorbar=dict(
                 title=dict(text=colorbar_title, side='right'),
@@ -738,14 +1195,20 @@ def create_filtered_contour_plot(nodes, elements, field_values, title, colorbar_
                 thickness=20,
                 len=0.7
             ),
-            hovertemplate='<b>Value</b>: %{intensity:.3e}<br>' +
-                          '<b>X</b>: %{x:.3f}<br>' +
-                          '<b>Y</b>: %{y:.3f}<br>' +
-                          '<extra></extra>',
+            hovertemplate=None if sparse_hover else (
+                '<b>Value</b>: %{intensity:.3e}<br>' +
+                '<b>X</b>: %{x:.3f}<br>' +
+                '<b>Y</b>: %{y:.3f}<br>' +
+                '<extra></extra>'
+            ),
+            hoverinfo='skip' if sparse_hover else None,
             showscale=True
         ))
         plot_title = title
 
+    if sparse_hover:
+        fig.add_trace(_hover_probe(go, geometry, None if threshold is not None else field_values))
+
     fig.update_layout(
         title=dict(text=plot_title, x=0.5, xanchor='center'),
         scene=dict(
@@ -768,16 +1231,25 @@ def create_filtered_contour_plot(nodes, elements, field_values, title, colorbar_
     return fig, stats
 
 
-def create_deformed_configuration_plot(nodes, elements, displacements, scale_factor=1.0, height=700):
+@st.cache_resource(show_spinner=False, max_entries=8, hash_funcs={np.ndarray: _array_hash})
+def _displacement_magnitude(displacements):
+    """Nodal displacement magnitude (cached)
+
+    Independent of the deformation scale, so moving the scale slider only
+    recomputes the deformed coordinates. Shared; must not be modified.
+    """
+    return np.hypot(displacements[:, 0], displacements[:, 1])
+
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs={np.ndarray: _array_hash})
+def create_deformed_configuration_plot(geometry, displacements, scale_factor=1.0, height=700):
     """
     Create an interactive plot showing deformed and undeformed configurations.
 
     Parameters
     ----------
-    nodes : ndarray
-        Nodes array with original coordinates (N x 5): [node_id, x, y, bc_x, bc_y]
-    elements : ndarray
-        Elements array with connectivity (M x 7+): [ele_id, ele_type, mat_id, node1, node2, ...]
+    geometry : dict
+        Undeformed mesh coordinates and triangles from ``_plot_geometry``
     displacements : ndarray
         Displacement array (N x 2): [ux, uy] for each node
     scale_factor : float
@@ -793,18 +1265,18 @@ def create_deformed_configuration_plot(nodes, elements, displacements, scale_fac
     import plotly.graph_objects as go
 
     # Extract original coordinates
-    x_orig = nodes[:, 1]
-    y_orig = nodes[:, 2]
+    x_orig = geometry['x']
+    y_orig = geometry['y']
 
     # Compute deformed coordinates
-    x_def = x_orig + scale_factor * displacements[:, 0]
-    y_def = y_orig + scale_factor * displacements[:, 1]
+    x_def = _display_array(x_orig + scale_factor * displacements[:, 0])
+    y_def = _display_array(y_orig + scale_factor * displacements[:, 1])
 
     # Compute displacement magnitude
-    disp_mag = np.sqrt(displacements[:, 0]**2 + displacements[:, 1]**2)
+    disp_mag = _display_array(_displacement_magnitude(displacements))
 
     # Get element connectivity (triangles)
-    triangles = elements[:, 3:6].astype(int)
+    triangles = geometry['triangles']
 
     # Create figure with two meshes
     fig = go.Figure()
@@ -813,7 +1285,7 @@ def create_deformed_configuration_plot(nodes, elements, displacements, scale_fac
     fig.add_trace(go.Mesh3d(
         x=x_orig,
         y=y_orig,
-        z=np.zeros_like(x_orig),
+        z=geometry['z0'],
         i=triangles[:, 0],
         j=triangles[:, 1],
         k=triangles[:, 2],
@@ -829,7 +1301,7 @@ def create_deformed_configuration_plot(nodes, elements, displacements, scale_fac
     fig.add_trace(go.Mesh3d(
         x=x_def,
         y=y_def,
-        z=np.zeros_like(x_def),
+        z=geometry['z0'],
         i=triangles[:, 0],
         j=triangles[:, 1],
         k=triangles[:, 2],
@@ -883,16 +1355,60 @@ def create_deformed_configuration_plot(nodes, elements, displacements, scale_fac
     return fig
 
 
-def create_reaction_forces_plot(nodes, elements, reactions, loads_array=None, height=700):
+def _force_arrows(go, geometry, forces, scale, color, label, to_node=False):
+    """Single Scatter3d trace with one arrow per non-zero nodal force
+
+    ``forces`` is (N x 3): [node_id, Fx, Fy]. Arrows start at the node,
+    or end at it if ``to_node`` (applied loads); the segments are separated
+    by NaN gaps so all arrows share one trace. Returns None if every force
+    is zero.
+    """
+    forces = forces[(np.abs(forces[:, 1]) > 1e-10) | (np.abs(forces[:, 2]) > 1e-10)]
+    n_arrows = len(forces)
+    if n_arrows == 0:
+        return None
+
+    node_ids = forces[:, 0].astype(int)
+    node_xy = np.column_stack([geometry['x'][node_ids], geometry['y'][node_ids]])
+    arrow_xy = forces[:, 1:3] * scale
+
+    # Per arrow: tail, head, gap
+    points = np.full((n_arrows, 3, 2), np.nan)
+    if to_node:
+        points[:, 0] = node_xy - arrow_xy
+        points[:, 1] = node_xy
+        sizes, symbols = [8, 4, 0], ['diamond', 'circle', 'circle']
+    else:
+        points[:, 0] = node_xy
+        points[:, 1] = node_xy + arrow_xy
+        sizes, symbols = [4, 8, 0], ['circle', 'diamond', 'circle']
+    points = points.reshape(-1, 2)
+
+    return go.Scatter3d(
+        x=points[:, 0],
+        y=points[:, 1],
+        z=np.tile([0.0, 0.0, np.nan], n_arrows),
+        mode='lines+markers',
+        line=dict(color=color, width=6),
+        marker=dict(size=sizes * n_arrows, color=color, symbol=symbols * n_arrows),
+        showlegend=False,
+        customdata=np.repeat(forces, 3, axis=0),
+        hovertemplate='<b>Node %{customdata[0]:.0f}</b><br>' +
+                     f'{label}x: ' + '%{customdata[1]:.3e} N<br>' +
+                     f'{label}y: ' + '%{customdata[2]:.3e} N<br>' +
+                     '<extra></extra>'
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs={np.ndarray: _array_hash})
+def create_reaction_forces_plot(geometry, reactions, loads_array=None, height=700):
     """
     Create a plot showing reaction forces as vector arrows on the mesh.
 
     Parameters
     ----------
-    nodes : ndarray
-        Nodes array with coordinates
-    elements : ndarray
-        Elements array with connectivity
+    geometry : dict
+        Mesh coordinates and triangles from ``_plot_geometry``
     reactions : ndarray
         Reactions array (N x 3): [node_id, Rx, Ry]
     loads_array : ndarray or None
@@ -907,12 +1423,8 @@ def create_reaction_forces_plot(nodes, elements, reactions, loads_array=None, he
     """
     import plotly.graph_objects as go
 
-    # Extract coordinates
-    x = nodes[:, 1]
-    y = nodes[:, 2]
-
-    # Get element connectivity
-    triangles = elements[:, 3:6].astype(int)
+    # Coordinates and triangle connectivity (shared by all plots of a solve)
+    x, y, triangles = geometry['x'], geometry['y'], geometry['triangles']
 
     # Create figure with mesh
     fig = go.Figure()
@@ -921,7 +1433,7 @@ def create_reaction_forces_plot(nodes, elements, reactions, loads_array=None, he
     fig.add_trace(go.Mesh3d(
         x=x,
         y=y,
-        z=np.zeros_like(x),
+        z=geometry['z0'],
         i=triangles[:, 0],
         j=triangles[:, 1],
         k=triangles[:, 2],
@@ -935,75 +1447,24 @@ def create_reaction_forces_plot(nodes, elements, reactions, loads_array=None, he
 
     # Calculate arrow scaling
     max_reaction = np.max(np.abs(reactions[:, 1:])) if len(reactions) > 0 else 1.0
-    coords = nodes[:, 1:3]
-    char_length = max(np.max(coords[:, 0]) - np.min(coords[:, 0]),
-                     np.max(coords[:, 1]) - np.min(coords[:, 1]))
+    char_length = max(np.max(x) - np.min(x), np.max(y) - np.min(y))
     arrow_scale = 0.1 * char_length / max_reaction if max_reaction > 0 else 0.1 * char_length
 
     # Add reaction force arrows
-    for reaction in reactions:
-        node_id = int(reaction[0])
-        Rx = reaction[1]
-        Ry = reaction[2]
-
-        # Get node coordinates
-        node_x = nodes[node_id, 1]
-        node_y = nodes[node_id, 2]
-
-        # Draw arrow if reaction is non-zero
-        if abs(Rx) > 1e-10 or abs(Ry) > 1e-10:
-            # Arrow endpoint
-            end_x = node_x + Rx * arrow_scale
-            end_y = node_y + Ry * arrow_scale
-
-            # Arrow line
-            fig.add_trace(go.Scatter3d(
-                x=[node_x, end_x],
-                y=[node_y, end_y],
-                z=[0, 0],
-                mode='lines+markers',
-                line=dict(color='red', width=6),
-                marker=dict(size=[4, 8], color='red', symbol=['circle', 'diamond']),
-                name=f'Reaction {node_id}',
-                showlegend=False,
-                hovertemplate=f'<b>Node {node_id}</b><br>' +
-                             f'Rx: {Rx:.3e} N<br>' +
-                             f'Ry: {Ry:.3e} N<br>' +
-                             '<extra></extra>'
-            ))
+    reaction_arrows = _force_arrows(go, geometry, reactions, arrow_scale, 'red', 'R')
+    if reaction_arrows is not None:
+        fig.add_trace(reaction_arrows)
 
     # Add applied load arrows if provided
     if loads_array is not None and len(loads_array) > 0:
         max_load = np.max(np.abs(loads_array[:, 1:]))
         load_arrow_scale = 0.1 * char_length / max_load if max_load > 0 else 0.1 * char_length
 
-        for load in loads_array:
-            node_id = int(load[0])
-            Fx = load[1]
-            Fy = load[2]
-
-            if abs(Fx) > 1e-10 or abs(Fy) > 1e-10:
-                node_x = nodes[node_id, 1]
-                node_y = nodes[node_id, 2]
-
-                # Arrow starts away from node (load is applied TO the node)
-                start_x = node_x - Fx * load_arrow_scale
-                start_y = node_y - Fy * load_arrow_scale
-
-                fig.add_trace(go.Scatter3d(
-                    x=[start_x, node_x],
-                    y=[start_y, node_y],
-                    z=[0, 0],
-                    mode='lines+markers',
-                    line=dict(color='green', width=6),
-                    marker=dict(size=[8, 4], color='green', symbol=['diamond', 'circle']),
-                    name=f'Load {node_id}',
-                    showlegend=False,
-                    hovertemplate=f'<b>Node {node_id}</b><br>' +
-                                 f'Fx: {Fx:.3e} N<br>' +
-                                 f'Fy: {Fy:.3e} N<br>' +
-                                 '<extra></extra>'
-                ))
+        # Arrow starts away from node (load is applied TO the node)
+        load_arrows = _force_arrows(go, geometry, loads_array, load_arrow_scale, 'green', 'F',
+                                    to_node=True)
+        if load_arrows is not None:
+            fig.add_trace(load_arrows)
 
     fig.update_layout(
         title=dict(
@@ -1087,16 +1548,15 @@ def calculate_principal_stress_directions(stresses):
     }
 
 
-def create_principal_stress_trajectories_plot(nodes, elements, stresses, height=700, show_mode='both'):
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs={np.ndarray: _array_hash})
+def create_principal_stress_trajectories_plot(geometry, stresses, height=700, show_mode='both'):
     """
     Create a plot showing principal stress trajectories as arrows.
 
     Parameters
     ----------
-    nodes : ndarray
-        Nodes array with coordinates
-    elements : ndarray
-        Elements array with connectivity
+    geometry : dict
+        Mesh coordinates and triangles from ``_plot_geometry``
     stresses : ndarray
         Stress array (N x 3): [σxx, σyy, τxy]
     height : int
@@ -1111,12 +1571,8 @@ def create_principal_stress_trajectories_plot(nodes, elements, stresses, height=
     """
     import plotly.graph_objects as go
 
-    # Extract coordinates
-    x = nodes[:, 1]
-    y = nodes[:, 2]
-
-    # Get element connectivity
-    triangles = elements[:, 3:6].astype(int)
+    # Coordinates and triangle connectivity (shared by all plots of a solve)
+    x, y, triangles = geometry['x'], geometry['y'], geometry['triangles']
 
     # Calculate principal stress directions
     principal = calculate_principal_stress_directions(stresses)
@@ -1146,11 +1602,11 @@ def create_principal_stress_trajectories_plot(nodes, elements, stresses, height=
     fig.add_trace(go.Mesh3d(
         x=x,
         y=y,
-        z=np.zeros_like(x),
+        z=geometry['z0'],
         i=triangles[:, 0],
         j=triangles[:, 1],
         k=triangles[:, 2],
-        intensity=mesh_intensity,
+        intensity=_display_array(mesh_intensity),
         colorscale='RdYlBu_r',
         colorbar=dict(
             title=dict(text=color_title, side='right'),
@@ -1164,13 +1620,11 @@ def create_principal_stress_trajectories_plot(nodes, elements, stresses, height=
     ))
 
     # Calculate arrow scaling
-    coords = nodes[:, 1:3]
-    char_length = max(np.max(coords[:, 0]) - np.min(coords[:, 0]),
-                     np.max(coords[:, 1]) - np.min(coords[:, 1]))
+    char_length = max(np.max(x) - np.min(x), np.max(y) - np.min(y))
     arrow_length = char_length * 0.03  # Fixed arrow length for direction
 
     # Downsample nodes for clearer visualization
-    n_nodes = len(nodes)
+    n_nodes = len(x)
     skip = max(1, n_nodes // 300)  # Show ~300 arrows max
 
     # Add direction arrows at sampled nodes
@@ -1314,10 +1768,14 @@ def verify_equilibrium(reactions, loads_array, nodes):
     }
 
 
+@_fragment
 def display_solver_results(results):
     """
     Display SolidsPy solver results in Streamlit with interactive Plotly visualizations.
 
+    Runs as a fragment: moving a threshold or scale slider reruns only the
+    results section, not the inputs and solver panels of the calling page.
+
     Parameters
     ----------
     results : dict
@@ -1353,13 +1811,13 @@ def display_solver_results(results):
     try:
         # Extract data
         nodes = results['nodes']
-        elements = results['elements']
+        geometry = results['plot_geometry']
         disp = results['displacements']
         strains = results['strains']
         stresses = results['stresses']
 
         # Compute displacement magnitude
-        disp_mag = np.sqrt(disp[:, 0]**2 + disp[:, 1]**2)
+        disp_mag = _displacement_magnitude(disp)
 
         # Create tabs for different result types
         tab1, tab2, tab3, tab4, tab5 = st.tabs(["🔵 Displacements", "🟢 Strains", "🔴 Stresses", "🟣 Principal Stresses", "⚖️ Reactions"])
@@ -1372,7 +1830,7 @@ def display_solver_results(results):
 
             with subtab1:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, disp_mag,
+                    geometry, disp_mag,
                     "Displacement Magnitude",
                     "Displacement (m)",
                     height=700
@@ -1381,7 +1839,7 @@ def display_solver_results(results):
 
             with subtab2:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, disp[:, 0],
+                    geometry, disp[:, 0],
                     "Horizontal Displacement (ux)",
                     "ux (m)",
                     height=700
@@ -1390,7 +1848,7 @@ def display_solver_results(results):
 
             with subtab3:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, disp[:, 1],
+                    geometry, disp[:, 1],
                     "Vertical Displacement (uy)",
                     "uy (m)",
                     height=700
@@ -1405,9 +1863,8 @@ def display_solver_results(results):
                 max_disp = results['max_displacement']
 
                 # Compute characteristic dimension (to suggest reasonable scale factors)
-                coords = nodes[:, 1:3]
-                x_range = np.max(coords[:, 0]) - np.min(coords[:, 0])
-                y_range = np.max(coords[:, 1]) - np.min(coords[:, 1])
+                x_range = np.max(geometry['x']) - np.min(geometry['x'])
+                y_range = np.max(geometry['y']) - np.min(geometry['y'])
                 characteristic_length = max(x_range, y_range)
 
                 # Suggest scale factor: make max displacement ~5-10% of characteristic length
@@ -1437,7 +1894,7 @@ def display_solver_results(results):
 
                 # Create deformed configuration plot
                 fig = create_deformed_configuration_plot(
-                    nodes, elements, disp,
+                    geometry, disp,
                     scale_factor=scale_factor,
                     height=700
                 )
@@ -1453,7 +1910,7 @@ def display_solver_results(results):
 
             with subtab1:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, strains[:, 0],
+                    geometry, strains[:, 0],
                     "Normal Strain (ε-xx)",
                     "ε-xx",
                     height=700
@@ -1462,7 +1919,7 @@ def display_solver_results(results):
 
             with subtab2:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, strains[:, 1],
+                    geometry, strains[:, 1],
                     "Normal Strain (ε-yy)",
                     "ε-yy",
                     height=700
@@ -1471,7 +1928,7 @@ def display_solver_results(results):
 
             with subtab3:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, strains[:, 2],
+                    geometry, strains[:, 2],
                     "Shear Strain (γ-xy)",
                     "γ-xy",
                     height=700
@@ -1542,27 +1999,21 @@ def display_solver_results(results):
                     st.success(f"✅ FILTERED VIEW ACTIVE - Limit: {threshold_mpa:.1f} MPa")
                     threshold_pa = threshold_mpa * 1e6
 
-                    # Create binary mask
-                    mask = von_mises >= threshold_pa
-                    exceeding_count = np.sum(mask)
+                    # Count exceeding nodes on the sorted field (cached per field)
+                    sorted_field, tri_max, _ = _field_extremes(geometry['triangles'], von_mises)
+                    exceeding_count = len(sorted_field) - np.searchsorted(sorted_field, threshold_pa)
                     percentage = (exceeding_count / len(von_mises)) * 100
 
-                    # Color each triangle
-                    triangle_colors = []
-                    for tri in elements[:, 3:6].astype(int):
-                        if np.any(mask[tri]):
-                            triangle_colors.append('red')
-                        else:
-                            triangle_colors.append('lightgray')
+                    # Color each triangle (red if any vertex exceeds the limit)
+                    triangle_colors = np.where(tri_max >= threshold_pa, 'red', 'lightgray').tolist()
 
                     # Create figure
                     import plotly.graph_objects as go
-                    x = nodes[:, 1]
-                    y = nodes[:, 2]
-                    triangles = elements[:, 3:6].astype(int)
+                    x, y = geometry['x'], geometry['y']
+                    triangles = geometry['triangles']
 
                     fig = go.Figure(data=go.Mesh3d(
-                        x=x, y=y, z=np.zeros_like(x),
+                        x=x, y=y, z=geometry['z0'],
                         i=triangles[:, 0],
                         j=triangles[:, 1],
                         k=triangles[:, 2],
@@ -1599,7 +2050,7 @@ def display_solver_results(results):
                 else:
                     st.info("ℹ️ CONTINUOUS VIEW - Enable filter above to identify overstressed regions")
                     fig = create_interactive_contour_plot(
-                        nodes, elements, von_mises,
+                        geometry, von_mises,
                         "Von Mises Stress",
                         "σ (Pa)",
                         height=700
@@ -1608,7 +2059,7 @@ def display_solver_results(results):
 
             with subtab2:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, sigma_xx,
+                    geometry, sigma_xx,
                     "Normal Stress (σ-xx)",
                     "σ-xx (Pa)",
                     height=700
@@ -1617,7 +2068,7 @@ def display_solver_results(results):
 
             with subtab3:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, sigma_yy,
+                    geometry, sigma_yy,
                     "Normal Stress (σ-yy)",
                     "σ-yy (Pa)",
                     height=700
@@ -1626,7 +2077,7 @@ def display_solver_results(results):
 
             with subtab4:
                 fig = create_interactive_contour_plot(
-                    nodes, elements, tau_xy,
+                    geometry, tau_xy,
                     "Shear Stress (τ-xy)",
                     "τ-xy (Pa)",
                     height=700
@@ -1711,27 +2162,21 @@ def display_solver_results(results):
                     st.success(f"✅ FILTERED VIEW ACTIVE - Limit: {threshold_mpa_s1:.1f} MPa")
                     threshold_pa_s1 = threshold_mpa_s1 * 1e6
 
-                    # Create binary mask
-                    mask = sigma_1 >= threshold_pa_s1
-                    exceeding_count = np.sum(mask)
+                    # Count exceeding nodes on the sorted field (cached per field)
+                    sorted_field, tri_max, _ = _field_extremes(geometry['triangles'], sigma_1)
+                    exceeding_count = len(sorted_field) - np.searchsorted(sorted_field, threshold_pa_s1)
                     percentage = (exceeding_count / len(sigma_1)) * 100
 
-                    # Color each triangle
-                    triangle_colors = []
-                    for tri in elements[:, 3:6].astype(int):
-                        if np.any(mask[tri]):
-                            triangle_colors.append('red')
-                        else:
-                            triangle_colors.append('lightgray')
+                    # Color each triangle (red if any vertex exceeds the limit)
+                    triangle_colors = np.where(tri_max >= threshold_pa_s1, 'red', 'lightgray').tolist()
 
                     # Create figure
                     import plotly.graph_objects as go
-                    x = nodes[:, 1]
-                    y = nodes[:, 2]
-                    triangles = elements[:, 3:6].astype(int)
+                    x, y = geometry['x'], geometry['y']
+                    triangles = geometry['triangles']
 
                     fig = go.Figure(data=go.Mesh3d(
-                        x=x, y=y, z=np.zeros_like(x),
+                        x=x, y=y, z=geometry['z0'],
                         i=triangles[:, 0],
                         j=triangles[:, 1],
                         k=triangles[:, 2],
@@ -1768,7 +2213,7 @@ def display_solver_results(results):
                 else:
                     st.info("ℹ️ CONTINUOUS VIEW - Enable filter above to identify overstressed regions")
                     fig = create_interactive_contour_plot(
-                        nodes, elements, sigma_1,
+                        geometry, sigma_1,
                         "Maximum Principal Stress (σ₁)",
                         "σ₁ (Pa)",
                         height=700
@@ -1834,27 +2279,21 @@ def display_solver_results(results):
                     st.success(f"✅ FILTERED VIEW ACTIVE - Limit: {threshold_mpa_s2:.1f} MPa")
                     threshold_pa_s2 = threshold_mpa_s2 * 1e6
 
-                    # Create binary mask
-                    mask = np.abs(sigma_2) >= threshold_pa_s2  # Use absolute value for σ₂
-                    exceeding_count = np.sum(mask)
+                    # Count exceeding nodes on the sorted field (cached per field)
+                    sorted_field, tri_max, _ = _field_extremes(geometry['triangles'], np.abs(sigma_2))  # Use absolute value for σ₂
+                    exceeding_count = len(sorted_field) - np.searchsorted(sorted_field, threshold_pa_s2)
                     percentage = (exceeding_count / len(sigma_2)) * 100
 
-                    # Color each triangle
-                    triangle_colors = []
-                    for tri in elements[:, 3:6].astype(int):
-                        if np.any(mask[tri]):
-                            triangle_colors.append('red')
-                        else:
-                            triangle_colors.append('lightgray')
+                    # Color each triangle (red if any vertex exceeds the limit)
+                    triangle_colors = np.where(tri_max >= threshold_pa_s2, 'red', 'lightgray').tolist()
 
                     # Create figure
                     import plotly.graph_objects as go
-                    x = nodes[:, 1]
-                    y = nodes[:, 2]
-                    triangles = elements[:, 3:6].astype(int)
+                    x, y = geometry['x'], geometry['y']
+                    triangles = geometry['triangles']
 
                     fig = go.Figure(data=go.Mesh3d(
-                        x=x, y=y, z=np.zeros_like(x),
+                        x=x, y=y, z=geometry['z0'],
                         i=triangles[:, 0],
                         j=triangles[:, 1],
                         k=triangles[:, 2],
@@ -1891,7 +2330,7 @@ def display_solver_results(results):
                 else:
                     st.info("ℹ️ CONTINUOUS VIEW - Enable filter above to identify overstressed regions")
                     fig = create_interactive_contour_plot(
-                        nodes, elements, sigma_2,
+                        geometry, sigma_2,
                         "Minimum Principal Stress (σ₂)",
                         "σ₂ (Pa)",
                         height=700
@@ -1950,27 +2389,21 @@ def display_solver_results(results):
                     st.success(f"✅ FILTERED VIEW ACTIVE - Shear Limit: {threshold_mpa_tmax:.1f} MPa")
                     threshold_pa_tmax = threshold_mpa_tmax * 1e6
 
-                    # Create binary mask
-                    mask = tau_max >= threshold_pa_tmax
-                    exceeding_count = np.sum(mask)
+                    # Count exceeding nodes on the sorted field (cached per field)
+                    sorted_field, tri_max, _ = _field_extremes(geometry['triangles'], tau_max)
+                    exceeding_count = len(sorted_field) - np.searchsorted(sorted_field, threshold_pa_tmax)
                     percentage = (exceeding_count / len(tau_max)) * 100
 
-                    # Color each triangle
-                    triangle_colors = []
-                    for tri in elements[:, 3:6].astype(int):
-                        if np.any(mask[tri]):
-                            triangle_colors.append('red')
-                        else:
-                            triangle_colors.append('lightgray')
+                    # Color each triangle (red if any vertex exceeds the limit)
+                    triangle_colors = np.where(tri_max >= threshold_pa_tmax, 'red', 'lightgray').tolist()
 
                     # Create figure
                     import plotly.graph_objects as go
-                    x = nodes[:, 1]
-                    y = nodes[:, 2]
-                    triangles = elements[:, 3:6].astype(int)
+                    x, y = geometry['x'], geometry['y']
+                    triangles = geometry['triangles']
 
                     fig = go.Figure(data=go.Mesh3d(
-                        x=x, y=y, z=np.zeros_like(x),
+                        x=x, y=y, z=geometry['z0'],
                         i=triangles[:, 0],
                         j=triangles[:, 1],
                         k=triangles[:, 2],
@@ -2007,7 +2440,7 @@ def display_solver_results(results):
                 else:
                     st.info("ℹ️ CONTINUOUS VIEW - Enable filter above to identify overstressed regions")
                     fig = create_interactive_contour_plot(
-                        nodes, elements, tau_max,
+                        geometry, tau_max,
                         "Maximum Shear Stress (τmax)",
                         "τmax (Pa)",
                         height=700
@@ -2041,7 +2474,7 @@ def display_solver_results(results):
 
                 # Create trajectory plot
                 fig = create_principal_stress_trajectories_plot(
-                    nodes, elements, stresses,
+                    geometry, stresses,
                     height=700,
                     show_mode=show_mode
                 )
@@ -2116,7 +2549,7 @@ def display_solver_results(results):
             st.markdown("#### 🎯 Force Diagram")
             st.info("💡 Red arrows = Reaction forces | Green arrows = Applied loads")
 
-            fig = create_reaction_forces_plot(nodes, elements, reactions, loads_array, height=700)
+            fig = create_reaction_forces_plot(geometry, reactions, loads_array, height=700)
             st.plotly_chart(fig, use_container_width=True)
 
             st.caption("🔍 Hover over arrows to see force values | Arrow length is proportional to force magnitude")
@@ -2171,20 +2604,103 @@ def main():
         show_about()
 
 
-def show_model_builder():
-    """Show the main model builder interface"""
+@_fragment
+def render_output_files():
+    """Show the SolidsPy output file previews and the save-to-folder controls
+
+    Runs as a fragment so interacting with it does not rerun the builder.
+    """
+    output_files, _ = _builder_outputs()
+
+    st.markdown('<p class="section-header">✅ SolidsPy Output Files</p>', unsafe_allow_html=True)
+
+    tab1, tab2, tab3, tab4 = st.tabs(["nodes.txt", "eles.txt", "mater.txt", "loads.txt"])
+
+    with tab1:
+        st.code(_read_preview(output_files['nodes']), language="text")
+        st.download_button("Download nodes.txt", output_files['nodes'].read_bytes(), "nodes.txt")
+
+    with tab2:
+        st.code(_read_preview(output_files['eles']), language="text")
+        st.download_button("Download eles.txt", output_files['eles'].read_bytes(), "eles.txt")
+
+    with tab3:
+        st.code(_read_preview(output_files['mater']), language="text")
+        st.download_button("Download mater.txt", output_files['mater'].read_bytes(), "mater.txt")
+
+    with tab4:
+        if output_files['loads']:
+            st.code(_read_preview(output_files['loads']), language="text")
+            st.download_button("Download loads.txt", output_files['loads'].read_bytes(), "loads.txt")
+        else:
+            st.info("No loads defined for this model")
+
+    # Save to local folder with custom prefix
+    st.markdown("---")
+    st.markdown('<p class="section-header">💾 Save All Files to Local Folder</p>', unsafe_allow_html=True)
+
+    st.info("💡 This will save ALL files (YAML, GEO, MSH, and TXT files) to your output folder with the chosen prefix.")
+
+    col1, col2, col3 = st.columns([2, 2, 1])
 
-    # Model metadata
-    st.markdown('<p class="section-header">📝 Model Information</p>', unsafe_allow_html=True)
-    col1, col2 = st.columns(2)
     with col1:
-        model_name = st.text_input("Model Name", value="my_model", help="Unique name for your model")
+        # Get model name from session state if available
+        default_prefix = st.session_state.get('config_dict', {}).get('model_name', 'M')
+        file_prefix = st.text_input(
+            "File Prefix",
+            value=default_prefix,
+            help="Prefix for all files (e.g., 'Ho' → Ho.yaml, Ho.geo, Ho.msh, Honodes.txt, ...)"
+        )
+
     with col2:
-        description = st.text_input("Description (optional)", value="", help="Brief description of the model")
+        output_folder = st.text_input(
+            "Output Folder",
+            value="./output",
+            help="Local folder to save files (will be created if doesn't exist)"
+        )
 
-    st.markdown("---")
+    with col3:
+        st.write("")  # Spacer
+        st.write("")  # Spacer
+        if st.button("💾 Save All Files", use_container_width=True):
+            try:
+                # Create output folder if it doesn't exist
+                output_path = Path(output_folder)
+                output_path.mkdir(parents=True, exist_ok=True)
+
+                # Save files with prefix (YAML, GEO and MSH only if present)
+                files_to_write = {
+                    f"{file_prefix}.yaml": output_files.get('yaml'),
+                    f"{file_prefix}.geo": output_files.get('geo'),
+                    f"{file_prefix}.msh": output_files.get('msh'),
+                    f"{file_prefix}nodes.txt": output_files['nodes'],
+                    f"{file_prefix}eles.txt": output_files['eles'],
+                    f"{file_prefix}mater.txt": output_files['mater'],
+                    f"{file_prefix}loads.txt": output_files.get('loads'),
+                }
+
+                # Independent copies, run concurrently
+                jobs = [(source, output_path / name)
+                        for name, source in files_to_write.items() if source]
+                with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                    list(executor.map(lambda job: shutil.copyfile(*job), jobs))
+                files_saved = [str(dest) for _, dest in jobs]
+
+                st.success(f"✅ All {len(files_saved)} files saved successfully to: `{output_folder}/`")
+
+                st.markdown("**Files created:**")
+                for file_path in files_saved:
+                    st.markdown(f"- `{file_path}`")
+
+            except Exception as e:
+                st.error(f"❌ Error saving files: {str(e)}")
+
+
+def show_model_builder():
+    """Show the main model builder interface"""
 
-    # Geometry selection
+    # Geometry selection stays outside the form: it changes which inputs
+    # the form contains
     st.markdown('<p class="section-header">🎯 Geometry Type</p>', unsafe_allow_html=True)
 
     col1, col2 = st.columns([2, 1])
@@ -2207,56 +2723,77 @@ def show_model_builder():
 
     st.markdown("---")
 
-    # Geometry parameters
-    geom_params = create_geometry_params(geometry_type)
+    # All remaining inputs are batched in a form: editing them does not
+    # rerun the script until the model is generated
+    with st.form("model_builder_form"):
+        # Model metadata
+        st.markdown('<p class="section-header">📝 Model Information</p>', unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            model_name = st.text_input("Model Name", value="my_model", help="Unique name for your model")
+        with col2:
+            description = st.text_input("Description (optional)", value="", help="Brief description of the model")
 
-    st.markdown("---")
+        st.markdown("---")
 
-    # Materials
-    materials = create_material_inputs(geometry_type)
+        # Geometry parameters
+        geom_params = create_geometry_params(geometry_type)
 
-    st.markdown("---")
+        st.markdown("---")
 
-    # Boundary conditions
-    bcs = create_bc_inputs()
+        # Materials
+        materials = create_material_inputs(geometry_type)
 
-    st.markdown("---")
+        st.markdown("---")
 
-    # Loads
-    loads = create_load_inputs()
+        # Boundary conditions
+        bcs = create_bc_inputs()
 
-    st.markdown("---")
+        st.markdown("---")
 
-    # Mesh parameters
-    mesh_params = create_mesh_inputs()
+        # Loads
+        loads = create_load_inputs()
 
-    st.markdown("---")
+        st.markdown("---")
 
-    # Generate button
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("🚀 Generate Model Configuration", use_container_width=True):
-            try:
-                # Build YAML config
-                config_dict = build_yaml_config(
-                    model_name, description, geometry_type,
-                    geom_params, materials, bcs, loads, mesh_params
-                )
+        # Mesh parameters
+        mesh_params = create_mesh_inputs()
+
+        st.markdown("---")
+
+        # Generate button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            submitted = st.form_submit_button("🚀 Generate Model Configuration", use_container_width=True)
+
+    if submitted:
+        try:
+            # Build YAML config
+            config_dict = build_yaml_config(
+                model_name, description, geometry_type,
+                geom_params, materials, bcs, loads, mesh_params
+            )
 
-                # Convert to YAML string
-                yaml_content = yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
+            config_json = _config_key(config_dict)
+            config_hash = hashlib.blake2b(config_json.encode(), digest_size=16).hexdigest()
 
-                # Validate by loading
-                config = FEMConfig(**config_dict)
+            if (st.session_state.model_created
+                    and st.session_state.get('config_hash') == config_hash):
+                st.info("ℹ️ No changes since the last generated configuration")
+            else:
+                # Convert to YAML string and validate (cached on the config)
+                yaml_content = _serialize_config(config_json)
+                config = _validate_config(config_json)
 
                 st.session_state.yaml_content = yaml_content
                 st.session_state.config_dict = config_dict
+                st.session_state.config_hash = config_hash
                 st.session_state.model_created = True
 
                 st.success("✅ Model configuration created successfully!")
 
-            except Exception as e:
-                st.error(f"❌ Error creating model: {str(e)}")
+        except Exception as e:
+            st.error(f"❌ Error creating model: {str(e)}")
 
     # Show results
     if st.session_state.model_created:
@@ -2281,57 +2818,11 @@ def show_model_builder():
             if st.button("🔄 Convert to SolidsPy Format"):
                 try:
                     with st.spinner("Converting..."):
-                        # Create temp directory
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            # Save YAML
-                            yaml_path = Path(tmpdir) / f"{model_name}.yaml"
-                            with open(yaml_path, 'w') as f:
-                                f.write(st.session_state.yaml_content)
-
-                            # Load config and convert
-                            config = FEMConfig.from_yaml(str(yaml_path))
-                            converter = FEMConverter(config, output_dir=tmpdir)
-                            converter.convert()
-
-                            # Read output files as strings
-                            nodes = (Path(tmpdir) / "nodes.txt").read_text()
-                            eles = (Path(tmpdir) / "eles.txt").read_text()
-                            mater = (Path(tmpdir) / "mater.txt").read_text()
-
-                            loads_file = Path(tmpdir) / "loads.txt"
-                            loads_content = loads_file.read_text() if loads_file.exists() else None
-
-                            # Read GEO and MSH files
-                            geo_file = Path(tmpdir) / f"{model_name}.geo"
-                            msh_file = Path(tmpdir) / f"{model_name}.msh"
-
-                            geo_content = geo_file.read_text() if geo_file.exists() else None
-                            msh_content = msh_file.read_text() if msh_file.exists() else None
-
-                            # Also read arrays for solver
-                            nodes_array = np.loadtxt(str(Path(tmpdir) / "nodes.txt"), ndmin=2)
-                            elements_array = np.loadtxt(str(Path(tmpdir) / "eles.txt"), ndmin=2, dtype=int)
-                            materials_array = np.loadtxt(str(Path(tmpdir) / "mater.txt"), ndmin=2)
-                            loads_array = np.loadtxt(str(loads_file), ndmin=2) if loads_file.exists() else None
-
-                            st.session_state.output_files = {
-                                'yaml': st.session_state.yaml_content,
-                                'geo': geo_content,
-                                'msh': msh_content,
-                                'nodes': nodes,
-                                'eles': eles,
-                                'mater': mater,
-                                'loads': loads_content
-                            }
-
-                            st.session_state.output_arrays = {
-                                'nodes': nodes_array,
-                                'elements': elements_array,
-                                'materials': materials_array,
-                                'loads': loads_array
-                            }
-
-                            st.session_state.conversion_complete = True
+                        # Served from cache if this config was converted before
+                        config_json = _config_key(st.session_state.config_dict)
+                        _run_conversion(config_json)
+                        st.session_state.builder_output_config = config_json
+                        st.session_state.conversion_complete = True
 
                     st.success("✅ Conversion complete!")
 
@@ -2348,121 +2839,10 @@ def show_model_builder():
                 st.rerun()
 
         # Show converted files
-        if st.session_state.get('conversion_complete', False):
-            st.markdown("---")
-            st.markdown('<p class="section-header">✅ SolidsPy Output Files</p>', unsafe_allow_html=True)
-
-            tab1, tab2, tab3, tab4 = st.tabs(["nodes.txt", "eles.txt", "mater.txt", "loads.txt"])
-
-            with tab1:
-                st.code(st.session_state.output_files['nodes'], language="text")
-                st.download_button("Download nodes.txt", st.session_state.output_files['nodes'], "nodes.txt")
-
-            with tab2:
-                st.code(st.session_state.output_files['eles'], language="text")
-                st.download_button("Download eles.txt", st.session_state.output_files['eles'], "eles.txt")
-
-            with tab3:
-                st.code(st.session_state.output_files['mater'], language="text")
-                st.download_button("Download mater.txt", st.session_state.output_files['mater'], "mater.txt")
-
-            with tab4:
-                if st.session_state.output_files['loads']:
-                    st.code(st.session_state.output_files['loads'], language="text")
-                    st.download_button("Download loads.txt", st.session_state.output_files['loads'], "loads.txt")
-                else:
-                    st.info("No loads defined for this model")
-
-            # Save to local folder with custom prefix
+        if (st.session_state.get('conversion_complete', False)
+                and 'builder_output_config' in st.session_state):
             st.markdown("---")
-            st.markdown('<p class="section-header">💾 Save All Files to Local Folder</p>', unsafe_allow_html=True)
-
-            st.info("💡 This will save ALL files (YAML, GEO, MSH, and TXT files) to your output folder with the chosen prefix.")
-
-            col1, col2, col3 = st.columns([2, 2, 1])
-
-            with col1:
-                # Get model name from session state if available
-                default_prefix = st.session_state.get('config_dict', {}).get('model_name', 'M')
-                file_prefix = st.text_input(
-                    "File Prefix",
-                    value=default_prefix,
-                    help="Prefix for all files (e.g., 'Ho' → Ho.yaml, Ho.geo, Ho.msh, Honodes.txt, ...)"
-                )
-
-            with col2:
-                output_folder = st.text_input(
-                    "Output Folder",
-                    value="./output",
-                    help="Local folder to save files (will be created if doesn't exist)"
-                )
-
-            with col3:
-                st.write("")  # Spacer
-                st.write("")  # Spacer
-                if st.button("💾 Save All Files", use_container_width=True):
-                    try:
-                        # Create output folder if it doesn't exist
-                        output_path = Path(output_folder)
-                        output_path.mkdir(parents=True, exist_ok=True)
-
-                        # Save files with prefix
-                        files_saved = []
-
-                        # Save YAML configuration
-                        if st.session_state.output_files.get('yaml'):
-                            yaml_file = output_path / f"{file_prefix}.yaml"
-                            with open(yaml_file, 'w') as f:
-                                f.write(st.session_state.output_files['yaml'])
-                            files_saved.append(str(yaml_file))
-
-                        # Save GEO file (GMSH geometry)
-                        if st.session_state.output_files.get('geo'):
-                            geo_file = output_path / f"{file_prefix}.geo"
-                            with open(geo_file, 'w') as f:
-                                f.write(st.session_state.output_files['geo'])
-                            files_saved.append(str(geo_file))
-
-                        # Save MSH file (GMSH mesh)
-                        if st.session_state.output_files.get('msh'):
-                            msh_file = output_path / f"{file_prefix}.msh"
-                            with open(msh_file, 'w') as f:
-                                f.write(st.session_state.output_files['msh'])
-                            files_saved.append(str(msh_file))
-
-                        # Save nodes
-                        nodes_file = output_path / f"{file_prefix}nodes.txt"
-                        with open(nodes_file, 'w') as f:
-                            f.write(st.session_state.output_files['nodes'])
-                        files_saved.append(str(nodes_file))
-
-                        # Save elements
-                        eles_file = output_path / f"{file_prefix}eles.txt"
-                        with open(eles_file, 'w') as f:
-                            f.write(st.session_state.output_files['eles'])
-                        files_saved.append(str(eles_file))
-
-                        # Save materials
-                        mater_file = output_path / f"{file_prefix}mater.txt"
-                        with open(mater_file, 'w') as f:
-                            f.write(st.session_state.output_files['mater'])
-                        files_saved.append(str(mater_file))
-
-                        # Save loads (if present)
-                        if st.session_state.output_files.get('loads'):
-                            loads_file = output_path / f"{file_prefix}loads.txt"
-                            with open(loads_file, 'w') as f:
-                                f.write(st.session_state.output_files['loads'])
-                            files_saved.append(str(loads_file))
-
-                        st.success(f"✅ All {len(files_saved)} files saved successfully to: `{output_folder}/`")
-
-                        st.markdown("**Files created:**")
-                        for file_path in files_saved:
-                            st.markdown(f"- `{file_path}`")
-
-                    except Exception as e:
-                        st.error(f"❌ Error saving files: {str(e)}")
+            render_output_files()
 
             # Run SolidsPy Solver
             if SOLIDSPY_AVAILABLE:
@@ -2473,11 +2853,12 @@ def show_model_builder():
 
                 if st.button("🚀 Run SolidsPy Solver", key="solve_model", use_container_width=True):
                     with st.spinner("Running FEA analysis..."):
-                        # Get arrays from session state
-                        nodes_array = st.session_state.output_arrays['nodes']
-                        elements_array = st.session_state.output_arrays['elements']
-                        materials_array = st.session_state.output_arrays['materials']
-                        loads_array = st.session_state.output_arrays.get('loads')
+                        # Get arrays from the conversion cache
+                        _, output_arrays = _builder_outputs()
+                        nodes_array = output_arrays['nodes']
+                        elements_array = output_arrays['elements']
+                        materials_array = output_arrays['materials']
+                        loads_array = output_arrays.get('loads')
 
                         # Run solver
                         results = run_solidspy_solver(
@@ -2502,6 +2883,114 @@ def show_model_builder():
                 st.info("To enable solver, ensure the `solidspy/` folder is in the project directory.")
 
 
+# Physical group declarations in a GEO file, matched in a single pass:
+#   Physical Surface(id) = {...}; / Physical Line(id) = {...};  (GMSH standard)
+#   Physical Surface("name", id) / Physical Line("name", id)  (named)
+_PHYS_GROUP = re.compile(
+    r'Physical\s+(Surface|Line)\s*\(\s*'
+    r'(?:(?P<id>\d+)\s*\)\s*='
+    r'|"?(?P<name>[^"]*)"?\s*,\s*(?P<named_id>\d+)\s*\))'
+)
+
+
+TEMPLATES_DIR = Path("templates")
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _list_templates():
+    """Names of the .geo files in ``TEMPLATES_DIR`` (None if it is missing)"""
+    if not TEMPLATES_DIR.is_dir():
+        return None
+    return [f.name for f in TEMPLATES_DIR.glob("*.geo")]
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _read_template(name):
+    """Text of a .geo template from ``TEMPLATES_DIR``"""
+    return (TEMPLATES_DIR / name).read_text()
+
+
+@_fragment
+def render_geo_output_files(model_name):
+    """Show the GEO loader's output previews, downloads and save controls
+
+    Runs as a fragment so the save inputs do not rerun the whole loader.
+    """
+    st.markdown('<p class="section-header">✅ Output Files</p>', unsafe_allow_html=True)
+
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["nodes.txt", "eles.txt", "mater.txt", "loads.txt", "mesh"])
+
+    output_paths, _ = _geo_outputs()
+
+    with tab1:
+        st.code(_read_preview(output_paths['nodes']), language="text")
+        st.download_button("Download nodes.txt", output_paths['nodes'].read_bytes(), "nodes.txt", key="dl_nodes_geo")
+
+    with tab2:
+        st.code(_read_preview(output_paths['eles']), language="text")
+        st.download_button("Download eles.txt", output_paths['eles'].read_bytes(), "eles.txt", key="dl_eles_geo")
+
+    with tab3:
+        st.code(_read_preview(output_paths['mater']), language="text")
+        st.download_button("Download mater.txt", output_paths['mater'].read_bytes(), "mater.txt", key="dl_mater_geo")
+
+    with tab4:
+        if output_paths.get('loads'):
+            st.code(_read_preview(output_paths['loads']), language="text")
+            st.download_button("Download loads.txt", output_paths['loads'].read_bytes(), "loads.txt", key="dl_loads_geo")
+        else:
+            st.info("No loads defined")
+
+    with tab5:
+        st.info(f"MSH file: {output_paths['msh'].stat().st_size} bytes")
+        st.download_button("Download .msh file", output_paths['msh'].read_bytes(), f"{model_name}.msh",
+                           mime="application/octet-stream", key="dl_msh_geo")
+
+    # Save all files
+    st.markdown("---")
+    st.markdown('<p class="section-header">💾 Save All Files to Local Folder</p>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([2, 2, 1])
+
+    with col1:
+        file_prefix = st.text_input("File Prefix", value=model_name, key="prefix_geo")
+
+    with col2:
+        output_folder = st.text_input("Output Folder", value="./output", key="folder_geo")
+
+    with col3:
+        st.write("")
+        st.write("")
+        if st.button("💾 Save All Files", key="save_geo"):
+            try:
+                output_path = Path(output_folder)
+                output_path.mkdir(parents=True, exist_ok=True)
+
+                # Copy the converted files straight from disk
+                files_to_write = {
+                    f"{file_prefix}.geo": output_paths['geo'],
+                    f"{file_prefix}.msh": output_paths['msh'],
+                    f"{file_prefix}nodes.txt": output_paths['nodes'],
+                    f"{file_prefix}eles.txt": output_paths['eles'],
+                    f"{file_prefix}mater.txt": output_paths['mater'],
+                    f"{file_prefix}loads.txt": output_paths.get('loads'),
+                }
+                files_saved = []
+                for name, source in files_to_write.items():
+                    if source:
+                        shutil.copyfile(source, output_path / name)
+                        files_saved.append(str(output_path / name))
+
+                st.success(f"✅ All {len(files_saved)} files saved to: `{output_folder}/`")
+
+                st.markdown("**Files created:**")
+                for file_path in files_saved:
+                    st.markdown(f"- `{file_path}`")
+
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+
+
 def show_geo_loader():
     """Show the GEO file loader interface"""
     st.markdown('<p class="section-header">📂 Load External GEO File</p>', unsafe_allow_html=True)
@@ -2536,10 +3025,8 @@ def show_geo_loader():
     with col2:
         st.markdown("**Option 2: Select from templates/**")
         # List .geo files in templates folder
-        templates_path = Path("templates")
-        if templates_path.exists():
-            geo_files = list(templates_path.glob("*.geo"))
-            geo_file_names = [f.name for f in geo_files]
+        geo_file_names = _list_templates()
+        if geo_file_names is not None:
             if geo_file_names:
                 selected_template = st.selectbox("Choose template:", [""] + geo_file_names)
             else:
@@ -2558,9 +3045,7 @@ def show_geo_loader():
         geo_filename = uploaded_file.name
         st.success(f"✅ Loaded: {geo_filename}")
     elif selected_template:
-        geo_path = templates_path / selected_template
-        with open(geo_path, 'r') as f:
-            geo_content = f.read()
+        geo_content = _read_template(selected_template)
         geo_filename = selected_template
         st.success(f"✅ Loaded: {geo_filename}")
 
@@ -2569,7 +3054,7 @@ def show_geo_loader():
         st.markdown('<p class="section-header">👁️ GEO File Preview</p>', unsafe_allow_html=True)
 
         with st.expander("View GEO content", expanded=False):
-            st.code(geo_content, language="text")
+            st.code(_preview_text(geo_content), language="text")
 
         st.markdown("---")
 
@@ -2577,36 +3062,36 @@ def show_geo_loader():
         st.markdown('<p class="section-header">📊 Physical Groups Detected</p>', unsafe_allow_html=True)
 
         # Parse physical groups from GEO content
-        import re
-
         # Try both formats:
         # Format 1: Physical Surface("name", id) - with optional name
         # Format 2: Physical Surface(id) = {...}; - GMSH standard format
 
-        phys_surfaces = []
-        phys_lines = []
+        named = {'Surface': [], 'Line': []}
+        numbered = {'Surface': [], 'Line': []}
+        for match in _PHYS_GROUP.finditer(geo_content):
+            if match.group('id') is None:
+                named[match.group(1)].append((match.group('name'), match.group('named_id')))
+            else:
+                numbered[match.group(1)].append(match.group('id'))
 
         # Format 1: Physical Surface("name", id) or Physical Surface(name, id)
-        surfaces_fmt1 = re.findall(r'Physical\s+Surface\s*\(\s*"?([^"]*)"?\s*,\s*(\d+)\s*\)', geo_content)
-        for name, pid in surfaces_fmt1:
-            phys_surfaces.append((name, pid))
-
-        lines_fmt1 = re.findall(r'Physical\s+Line\s*\(\s*"?([^"]*)"?\s*,\s*(\d+)\s*\)', geo_content)
-        for name, pid in lines_fmt1:
-            phys_lines.append((name, pid))
+        phys_surfaces = named['Surface']
+        phys_lines = named['Line']
 
         # Format 2: Physical Surface(id) = {...};
-        surfaces_fmt2 = re.findall(r'Physical\s+Surface\s*\(\s*(\d+)\s*\)\s*=', geo_content)
-        for pid in surfaces_fmt2:
+        seen_surf = {pid for _, pid in phys_surfaces}
+        for pid in numbered['Surface']:
             # Generate default name if not already found
-            if not any(p == pid for _, p in phys_surfaces):
+            if pid not in seen_surf:
                 phys_surfaces.append((f"Surface_{pid}", pid))
+                seen_surf.add(pid)
 
-        lines_fmt2 = re.findall(r'Physical\s+Line\s*\(\s*(\d+)\s*\)\s*=', geo_content)
-        for pid in lines_fmt2:
+        seen_line = {pid for _, pid in phys_lines}
+        for pid in numbered['Line']:
             # Generate default name if not already found
-            if not any(p == pid for _, p in phys_lines):
+            if pid not in seen_line:
                 phys_lines.append((f"Line_{pid}", pid))
+                seen_line.add(pid)
 
         if phys_surfaces:
             st.markdown("**Physical Surfaces (for materials):**")
@@ -2620,342 +3105,149 @@ def show_geo_loader():
 
         st.markdown("---")
 
-        # Material properties
-        st.markdown('<p class="section-header">🔧 Material Properties</p>', unsafe_allow_html=True)
-
-        if phys_surfaces:
-            st.info(f"Define material properties for {len(phys_surfaces)} physical surface(s)")
-            materials = []
-
-            for name, pid in phys_surfaces:
-                st.markdown(f"**Physical Surface ID {pid}: {name if name else 'unnamed'}**")
-                col1, col2 = st.columns(2)
-                with col1:
-                    E = st.number_input(f"Young's Modulus (Pa)", value=2.1e11, format="%.2e", key=f"E_{pid}")
-                with col2:
-                    nu = st.number_input(f"Poisson's Ratio", min_value=0.0, max_value=0.49, value=0.3, step=0.01, format="%.3f", key=f"nu_{pid}")
-
-                materials.append({
-                    'physical_id': int(pid),
-                    'name': name if name else f'material_{pid}',
-                    'E': E,
-                    'nu': nu
-                })
-                st.divider()
-        else:
-            st.warning("⚠️ No Physical Surfaces found in GEO file. Add Physical Surface definitions to specify materials.")
-            materials = []
-
-        # Boundary conditions
-        st.markdown('<p class="section-header">🔒 Boundary Conditions</p>', unsafe_allow_html=True)
-
-        num_bcs = st.number_input("Number of Boundary Conditions", min_value=0, max_value=20, value=0, step=1)
-
-        bcs = []
-        for i in range(num_bcs):
-            st.markdown(f"**BC {i+1}**")
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                bc_name = st.text_input("Name", value=f"bc_{i+1}", key=f"bc_name_geo_{i}")
-                bc_phys_id = st.number_input("Physical Line ID", min_value=1, value=100+i, step=1, key=f"bc_phys_geo_{i}")
+        # All inputs are batched until Generate
+        with st.form("geo_gen_form"):
+            # Material properties
+            st.markdown('<p class="section-header">🔧 Material Properties</p>', unsafe_allow_html=True)
+
+            if phys_surfaces:
+                st.info(f"Define material properties for {len(phys_surfaces)} physical surface(s)")
+                materials = []
+
+                for name, pid in phys_surfaces:
+                    st.markdown(f"**Physical Surface ID {pid}: {name if name else 'unnamed'}**")
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        E = st.number_input(f"Young's Modulus (Pa)", value=2.1e11, format="%.2e", key=f"E_{pid}")
+                    with col2:
+                        nu = st.number_input(f"Poisson's Ratio", min_value=0.0, max_value=0.49, value=0.3, step=0.01, format="%.3f", key=f"nu_{pid}")
+
+                    materials.append({
+                        'physical_id': int(pid),
+                        'name': name if name else f'material_{pid}',
+                        'E': E,
+                        'nu': nu
+                    })
+                    st.divider()
+            else:
+                st.warning("⚠️ No Physical Surfaces found in GEO file. Add Physical Surface definitions to specify materials.")
+                materials = []
 
-            with col2:
-                x_constraint = st.selectbox("X Constraint", ["free", "fixed"], key=f"bc_x_geo_{i}")
+            import pandas as pd
 
-            with col3:
-                y_constraint = st.selectbox("Y Constraint", ["free", "fixed"], key=f"bc_y_geo_{i}")
+            # Boundary conditions: one editable table, rows added as needed
+            st.markdown('<p class="section-header">🔒 Boundary Conditions</p>', unsafe_allow_html=True)
 
-            bcs.append({
-                'name': bc_name,
-                'physical_id': int(bc_phys_id),
-                'constraints': {'x': x_constraint, 'y': y_constraint}
-            })
-            st.divider()
+            edited_bcs = st.data_editor(
+                pd.DataFrame({
+                    'name': pd.Series(dtype=str),
+                    'physical_id': pd.Series(dtype=int),
+                    'x': pd.Series(dtype=str),
+                    'y': pd.Series(dtype=str),
+                }),
+                key="bc_editor_geo",
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    'name': st.column_config.TextColumn("Name", required=True),
+                    'physical_id': st.column_config.NumberColumn("Physical Line ID", min_value=1,
+                                                                 step=1, required=True),
+                    'x': st.column_config.SelectboxColumn("X Constraint", options=["free", "fixed"],
+                                                          default="free", required=True),
+                    'y': st.column_config.SelectboxColumn("Y Constraint", options=["free", "fixed"],
+                                                          default="free", required=True),
+                }
+            )
 
-        # Loads
-        st.markdown('<p class="section-header">⚡ Loads</p>', unsafe_allow_html=True)
+            bcs = [
+                {
+                    'name': str(row['name']),
+                    'physical_id': int(row['physical_id']),
+                    'constraints': {'x': row['x'], 'y': row['y']}
+                }
+                for row in edited_bcs.dropna().to_dict('records')
+            ]
+
+            # Loads
+            st.markdown('<p class="section-header">⚡ Loads</p>', unsafe_allow_html=True)
+
+            edited_loads = st.data_editor(
+                pd.DataFrame({
+                    'name': pd.Series(dtype=str),
+                    'physical_id': pd.Series(dtype=int),
+                    'fx': pd.Series(dtype=float),
+                    'fy': pd.Series(dtype=float),
+                }),
+                key="load_editor_geo",
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    'name': st.column_config.TextColumn("Name", required=True),
+                    'physical_id': st.column_config.NumberColumn("Physical Line ID", min_value=1,
+                                                                 step=1, required=True),
+                    'fx': st.column_config.NumberColumn("Force X (N)", format="%.2f", default=0.0, required=True),
+                    'fy': st.column_config.NumberColumn("Force Y (N)", format="%.2f", default=-1000.0, required=True),
+                }
+            )
 
-        num_loads = st.number_input("Number of Loads", min_value=0, max_value=20, value=0, step=1)
+            loads = [
+                {
+                    'name': str(row['name']),
+                    'physical_id': int(row['physical_id']),
+                    'force': {'x': float(row['fx']), 'y': float(row['fy'])}
+                }
+                for row in edited_loads.dropna().to_dict('records')
+            ]
 
-        loads = []
-        for i in range(num_loads):
-            st.markdown(f"**Load {i+1}**")
-            col1, col2, col3 = st.columns(3)
+            # Mesh settings
+            st.markdown('<p class="section-header">🔲 Mesh Settings</p>', unsafe_allow_html=True)
 
+            col1, col2 = st.columns(2)
             with col1:
-                load_name = st.text_input("Name", value=f"load_{i+1}", key=f"load_name_geo_{i}")
-                load_phys_id = st.number_input("Physical Line ID", min_value=1, value=200+i, step=1, key=f"load_phys_geo_{i}")
-
+                mesh_size = st.number_input("Mesh Size (m)", min_value=0.001, value=0.1, step=0.01, format="%.3f")
             with col2:
-                fx = st.number_input("Force X (N)", value=0.0, format="%.2f", key=f"load_fx_geo_{i}")
-
-            with col3:
-                fy = st.number_input("Force Y (N)", value=-1000.0, format="%.2f", key=f"load_fy_geo_{i}")
-
-            loads.append({
-                'name': load_name,
-                'physical_id': int(load_phys_id),
-                'force': {'x': fx, 'y': fy},
-                'distribution': 'uniform'
-            })
-            st.divider()
-
-        # Mesh settings
-        st.markdown('<p class="section-header">🔲 Mesh Settings</p>', unsafe_allow_html=True)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            mesh_size = st.number_input("Mesh Size (m)", min_value=0.001, value=0.1, step=0.01, format="%.3f")
-        with col2:
-            element_type = st.selectbox(
-                "Element Type",
-                options=["triangle", "quad"],
-                index=0,
-                help="Triangle for standard meshes, Quad if GEO file uses 'Recombine Surface'"
-            )
-
-        st.markdown("---")
+                element_type = st.selectbox(
+                    "Element Type",
+                    options=["triangle", "quad"],
+                    index=0,
+                    help="Triangle for standard meshes, Quad if GEO file uses 'Recombine Surface'"
+                )
 
-        # Generate button
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("🚀 Generate Mesh and Convert", use_container_width=True):
-                try:
-                    with st.spinner("Processing..."):
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            # Save GEO file
-                            geo_path = Path(tmpdir) / f"{model_name}.geo"
-                            with open(geo_path, 'w') as f:
-                                f.write(geo_content)
-
-                            # Run GMSH
-                            from fem_converter import FEMConverter
-                            converter = FEMConverter.__new__(FEMConverter)
-                            gmsh_exe = converter._find_gmsh()
-
-                            if not gmsh_exe:
-                                st.error("❌ GMSH executable not found")
-                                raise FileNotFoundError("GMSH not found")
-
-                            msh_path = Path(tmpdir) / f"{model_name}.msh"
-                            result = subprocess.run(
-                                [gmsh_exe, str(geo_path), "-2", "-o", str(msh_path)],
-                                capture_output=True,
-                                text=True
-                            )
+            st.markdown("---")
 
-                            if result.returncode != 0:
-                                st.error(f"❌ GMSH Error: {result.stderr}")
-                                raise RuntimeError("GMSH failed")
-
-                            # Read mesh
-                            import meshio
-                            mesh = meshio.read(str(msh_path))
-                            points = mesh.points
-                            cells = mesh.cells
-                            cell_data = mesh.cell_data
-
-                            # Convert nodes
-                            import preprocesor as msh_proc
-                            nodes_array = msh_proc.node_writer(points, mesh.point_data)
-
-                            # Convert elements
-                            # Map element type to SolidsPy element ID
-                            ele_type_map = {
-                                'triangle': 3,
-                                'quad': 2
-                            }
-                            ele_type_id = ele_type_map[element_type]
-
-                            # For multiple materials
-                            elements_list = []
-                            nini = 0
-
-                            for mat_idx, mat in enumerate(materials):
-                                nf, layer_els = msh_proc.ele_writer(
-                                    cells, cell_data,
-                                    element_type,
-                                    mat['physical_id'],  # Physical surface ID from GMSH
-                                    ele_type_id,
-                                    mat_idx,              # Material tag = row index in mater.txt (0, 1, 2, ...)
-                                    nini
-                                )
-                                elements_list.append(layer_els)
-                                nini = nf
-
-                            if elements_list:
-                                elements_array = np.vstack(elements_list)
-                            else:
-                                st.error("❌ No elements extracted. Check physical surface IDs.")
-                                raise ValueError("No elements")
-
-                            # Apply boundary conditions
-                            for bc in bcs:
-                                bc_x = -1 if bc['constraints']['x'] == "fixed" else 0
-                                bc_y = -1 if bc['constraints']['y'] == "fixed" else 0
-                                nodes_array = msh_proc.boundary_conditions(
-                                    cells, cell_data,
-                                    bc['physical_id'],
-                                    nodes_array,
-                                    bc_x, bc_y
-                                )
-
-                            # Apply loads
-                            loads_array = None
-                            if loads:
-                                loads_list = []
-                                for load in loads:
-                                    load_array = msh_proc.loading(
-                                        cells, cell_data,
-                                        load['physical_id'],
-                                        load['force']['x'],
-                                        load['force']['y']
-                                    )
-                                    loads_list.append(load_array)
-
-                                if loads_list:
-                                    loads_array = np.vstack(loads_list)
-
-                            # Create materials array (only E and nu for SolidsPy)
-                            materials_array = np.zeros((len(materials), 2))
-                            for i, mat in enumerate(materials):
-                                materials_array[i, 0] = mat['E']
-                                materials_array[i, 1] = mat['nu']
-
-                            # Save to strings
-                            from io import StringIO
-
-                            nodes_str = StringIO()
-                            np.savetxt(nodes_str, nodes_array, fmt=("%d", "%.4f", "%.4f", "%d", "%d"))
-
-                            eles_str = StringIO()
-                            fmt_elements = ["%d", "%d", "%d"] + ["%d"] * (elements_array.shape[1] - 3)
-                            np.savetxt(eles_str, elements_array, fmt=fmt_elements)
-
-                            mater_str = StringIO()
-                            np.savetxt(mater_str, materials_array, fmt="%.6e")
-
-                            loads_str = None
-                            if loads_array is not None:
-                                loads_io = StringIO()
-                                np.savetxt(loads_io, loads_array, fmt=("%d", "%.6f", "%.6f"))
-                                loads_str = loads_io.getvalue()
-
-                            # Read GEO and MSH files
-                            msh_content = msh_path.read_text()
-
-                            st.session_state.output_files = {
-                                'geo': geo_content,
-                                'msh': msh_content,
-                                'nodes': nodes_str.getvalue(),
-                                'eles': eles_str.getvalue(),
-                                'mater': mater_str.getvalue(),
-                                'loads': loads_str
-                            }
-
-                            st.session_state.output_arrays = {
-                                'nodes': nodes_array,
-                                'elements': elements_array,
-                                'materials': materials_array,
-                                'loads': loads_array
-                            }
-
-                            st.session_state.conversion_complete = True
-                            st.session_state.model_name_geo = model_name
+            # Generate button
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                submitted = st.form_submit_button("🚀 Generate Mesh and Convert", use_container_width=True)
 
-                    st.success("✅ Conversion complete!")
+        if submitted:
+            try:
+                with st.spinner("Processing..."):
+                    run_json = _config_key({
+                        'model_name': model_name,
+                        'geo_content': geo_content,
+                        'materials': materials,
+                        'bcs': bcs,
+                        'loads': loads,
+                        'element_type': element_type
+                    })
+                    _run_geo_conversion(run_json)
+                    st.session_state.geo_run_json = run_json
+
+                    st.session_state.conversion_complete = True
+                    st.session_state.model_name_geo = model_name
+
+                st.success("✅ Conversion complete!")
 
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
-                    import traceback
-                    st.code(traceback.format_exc())
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+                import traceback
+                st.code(traceback.format_exc())
 
         # Show output
         if st.session_state.get('conversion_complete', False) and 'model_name_geo' in st.session_state:
             st.markdown("---")
-            st.markdown('<p class="section-header">✅ Output Files</p>', unsafe_allow_html=True)
-
-            tab1, tab2, tab3, tab4, tab5 = st.tabs(["nodes.txt", "eles.txt", "mater.txt", "loads.txt", "mesh"])
-
-            with tab1:
-                st.code(st.session_state.output_files['nodes'], language="text")
-                st.download_button("Download nodes.txt", st.session_state.output_files['nodes'], "nodes.txt", key="dl_nodes_geo")
-
-            with tab2:
-                st.code(st.session_state.output_files['eles'], language="text")
-                st.download_button("Download eles.txt", st.session_state.output_files['eles'], "eles.txt", key="dl_eles_geo")
-
-            with tab3:
-                st.code(st.session_state.output_files['mater'], language="text")
-                st.download_button("Download mater.txt", st.session_state.output_files['mater'], "mater.txt", key="dl_mater_geo")
-
-            with tab4:
-                if st.session_state.output_files.get('loads'):
-                    st.code(st.session_state.output_files['loads'], language="text")
-                    st.download_button("Download loads.txt", st.session_state.output_files['loads'], "loads.txt", key="dl_loads_geo")
-                else:
-                    st.info("No loads defined")
-
-            with tab5:
-                st.info(f"MSH file: {len(st.session_state.output_files['msh'])} bytes")
-                st.download_button("Download .msh file", st.session_state.output_files['msh'], f"{model_name}.msh", key="dl_msh_geo")
-
-            # Save all files
-            st.markdown("---")
-            st.markdown('<p class="section-header">💾 Save All Files to Local Folder</p>', unsafe_allow_html=True)
-
-            col1, col2, col3 = st.columns([2, 2, 1])
-
-            with col1:
-                file_prefix = st.text_input("File Prefix", value=model_name, key="prefix_geo")
-
-            with col2:
-                output_folder = st.text_input("Output Folder", value="./output", key="folder_geo")
-
-            with col3:
-                st.write("")
-                st.write("")
-                if st.button("💾 Save All Files", key="save_geo"):
-                    try:
-                        output_path = Path(output_folder)
-                        output_path.mkdir(parents=True, exist_ok=True)
-
-                        files_saved = []
-
-                        # Save GEO
-                        geo_file = output_path / f"{file_prefix}.geo"
-                        with open(geo_file, 'w') as f:
-                            f.write(st.session_state.output_files['geo'])
-                        files_saved.append(str(geo_file))
-
-                        # Save MSH
-                        msh_file = output_path / f"{file_prefix}.msh"
-                        with open(msh_file, 'w') as f:
-                            f.write(st.session_state.output_files['msh'])
-                        files_saved.append(str(msh_file))
-
-                        # Save TXT files
-                        for name in ['nodes', 'eles', 'mater']:
-                            txt_file = output_path / f"{file_prefix}{name}.txt"
-                            with open(txt_file, 'w') as f:
-                                f.write(st.session_state.output_files[name])
-                            files_saved.append(str(txt_file))
-
-                        if st.session_state.output_files.get('loads'):
-                            loads_file = output_path / f"{file_prefix}loads.txt"
-                            with open(loads_file, 'w') as f:
-                                f.write(st.session_state.output_files['loads'])
-                            files_saved.append(str(loads_file))
-
-                        st.success(f"✅ All {len(files_saved)} files saved to: `{output_folder}/`")
-
-                        st.markdown("**Files created:**")
-                        for file_path in files_saved:
-                            st.markdown(f"- `{file_path}`")
-
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
+            render_geo_output_files(model_name)
 
             # Run SolidsPy Solver
             if SOLIDSPY_AVAILABLE:
@@ -2966,11 +3258,12 @@ def show_geo_loader():
 
                 if st.button("🚀 Run SolidsPy Solver", key="solve_geo", use_container_width=True):
                     with st.spinner("Running FEA analysis..."):
-                        # Get arrays from session state
-                        nodes_array = st.session_state.output_arrays['nodes']
-                        elements_array = st.session_state.output_arrays['elements']
-                        materials_array = st.session_state.output_arrays['materials']
-                        loads_array = st.session_state.output_arrays.get('loads')
+                        # Get arrays from the conversion cache
+                        _, output_arrays = _geo_outputs()
+                        nodes_array = output_arrays['nodes']
+                        elements_array = output_arrays['elements']
+                        materials_array = output_arrays['materials']
+                        loads_array = output_arrays.get('loads')
 
                         # Run solver
                         results = run_solidspy_solver(
@@ -3037,7 +3330,7 @@ def show_analyze_existing():
             from io import StringIO
 
             nodes_array = np.loadtxt(StringIO(nodes_file.getvalue().decode('utf-8')), ndmin=2)
-            elements_array = np.loadtxt(StringIO(eles_file.getvalue().decode('utf-8')), ndmin=2, dtype=int)
+            elements_array = np.loadtxt(StringIO(eles_file.getvalue().decode('utf-8')), ndmin=2, dtype=np.int32)
             materials_array = np.loadtxt(StringIO(mater_file.getvalue().decode('utf-8')), ndmin=2)
 
             if loads_file:
@@ -3094,6 +3387,12 @@ def show_analyze_existing():
             st.info("To enable solver, ensure the `solidspy/` folder is in the project directory.")
 
 
+@st.cache_data(show_spinner=False)
+def _load_example(path):
+    """Read an example YAML file (cached across reruns)"""
+    return Path(path).read_text()
+
+
 def show_examples():
     """Show example models"""
     st.markdown('<p class="section-header">📚 Example Models</p>', unsafe_allow_html=True)
@@ -3108,8 +3407,7 @@ def show_examples():
     example_path = Path(examples[selected_example])
 
     if example_path.exists():
-        with open(example_path, 'r') as f:
-            content = f.read()
+        content = _load_example(str(example_path))
 
         st.code(content, language="yaml")
 